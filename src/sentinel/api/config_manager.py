@@ -9,14 +9,29 @@ import json
 import logging
 import os
 import pathlib
-from dataclasses import asdict
+import stat
+import tempfile
+from dataclasses import fields, is_dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from .models import (
     SharedConfig,
     ScanConfig,
-    ScanOptions,
     UserPreferences,
     ExportSettings,
     NotificationSettings,
@@ -24,8 +39,73 @@ from .models import (
     ProjectHistory,
 )
 
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T", bound="DataclassInstance")
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize config data to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _field_converter(field_type: Any) -> Optional[Callable[[Any], Any]]:
+    """Return the converter for a JSON value of the given field type, if any."""
+    if field_type is pathlib.Path:
+        return pathlib.Path
+    if isinstance(field_type, type) and is_dataclass(field_type):
+        return _build_loader(field_type)
+
+    # Optional[X]: empty values load as None, anything else converts as X
+    args = get_args(field_type)
+    if get_origin(field_type) is Union and type(None) in args:
+        inner = [arg for arg in args if arg is not type(None)]
+        if len(inner) == 1:
+            convert = _field_converter(inner[0])
+            if convert is not None:
+                return lambda value: convert(value) if value else None
+    return None
+
+
+@lru_cache(maxsize=None)
+def _build_loader(cls: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """
+    Build a dict -> dataclass loader for ``cls``.
+
+    Field introspection and per-field conversion (paths, nested dataclasses)
+    are resolved once per class; the returned loader only walks a prepared
+    list. Keys missing from the payload fall back to the dataclass defaults
+    and unknown keys are ignored.
+    """
+    converters = [(f.name, _field_converter(f.type)) for f in fields(cls)]
+
+    def load(data: Dict[str, Any]) -> T:
+        kwargs = {}
+        for name, convert in converters:
+            if name in data:
+                value = data[name]
+                kwargs[name] = convert(value) if convert is not None and value is not None else value
+        return cls(**kwargs)
+
+    return load
+
 
 class ConfigManager:
     """Manages loading and saving the SharedConfig used by GUI and CLI."""
@@ -33,6 +113,7 @@ class ConfigManager:
     def __init__(self, config_path: Optional[pathlib.Path] = None):
         self.config_path = config_path or self._get_default_config_path()
         self._config: Optional[SharedConfig] = None
+        self._cache: Optional[Tuple[Tuple[int, int], SharedConfig]] = None
 
     def _get_default_config_path(self) -> pathlib.Path:
         """Get platform-specific default configuration path."""
@@ -43,28 +124,65 @@ class ConfigManager:
         return base / "codesentinel" / "config.json"
 
     def load_config(self) -> SharedConfig:
-        """Load SharedConfig from disk (returns defaults on failure)."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                config = self._deserialize_config(data)
-                self._config = config
-                return config
-            except Exception as exc:
-                logger.warning("Failed to load SharedConfig, using defaults: %s", exc)
+        """
+        Load SharedConfig from disk (returns defaults on failure).
+
+        The parsed config is memoized on the file's mtime and size, so repeat
+        loads of an unchanged file skip JSON parsing and dataclass rebuilding.
+        The cached instance is shared between callers.
+        """
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return SharedConfig()
+
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == cache_key:
+            return self._cache[1]
+
+        try:
+            data = _loads(self.config_path.read_bytes())
+            config = self._deserialize_config(data)
+            self._config = config
+            self._cache = (cache_key, config)
+            return config
+        except Exception as exc:
+            logger.warning("Failed to load SharedConfig, using defaults: %s", exc)
         return SharedConfig()
 
     def save_config(self, config: SharedConfig) -> bool:
-        """Persist SharedConfig to disk."""
+        """
+        Persist SharedConfig to disk.
+
+        The config is written to a uniquely named sibling temp file and renamed
+        over the target, so readers never observe a partially written file and
+        concurrent savers never share a temp file. The existing file's
+        permission bits are carried over, since the config can hold API keys.
+        No fsync is issued; the rename alone is atomic on the same filesystem.
+        """
+        self._cache = None
+        tmp_name: Optional[str] = None
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self._serialize_config(config), f, indent=2)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.config_path.parent, prefix=self.config_path.name, suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(_dumps(self._serialize_config(config)))
+            try:
+                os.chmod(tmp_name, stat.S_IMODE(os.stat(self.config_path).st_mode))
+            except FileNotFoundError:
+                pass  # First save: keep mkstemp's owner-only permissions
+            os.replace(tmp_name, self.config_path)
             self._config = config
             return True
         except Exception as exc:
             logger.error("Failed to save SharedConfig: %s", exc)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
             return False
 
     def sync_with_cli(self) -> bool:
@@ -86,7 +204,7 @@ class ConfigManager:
         return {
             "scan_defaults": self._serialize_scan_config(config.scan_defaults),
             "ai_providers": {
-                name: asdict(cfg) for name, cfg in config.ai_providers.items()
+                name: self._serialize_dataclass(cfg) for name, cfg in config.ai_providers.items()
             },
             "user_preferences": self._serialize_dataclass(config.user_preferences),
             "recent_projects": [
@@ -104,19 +222,27 @@ class ConfigManager:
         }
 
     def _serialize_scan_config(self, scan_config: ScanConfig) -> Dict[str, Any]:
-        result = asdict(scan_config)
-        result["target_path"] = str(scan_config.target_path)
-        result["scan_options"] = self._serialize_dataclass(scan_config.scan_options)
-        return result
+        return self._serialize_dataclass(scan_config)
 
     def _serialize_dataclass(self, instance: Any) -> Dict[str, Any]:
-        normalized = asdict(instance)
-        return self._normalize_paths(normalized)
+        """
+        Convert a dataclass into a JSON-ready dict.
+
+        Walks the fields directly instead of using dataclasses.asdict, which
+        deep-copies every value (including each pathlib.Path) only for the
+        copies to be converted to strings afterwards.
+        """
+        return {
+            f.name: self._normalize_paths(getattr(instance, f.name))
+            for f in fields(instance)
+        }
 
     def _normalize_paths(self, value: Any) -> Any:
         """Recursively convert pathlib.Path values to strings."""
         if isinstance(value, pathlib.Path):
             return str(value)
+        if is_dataclass(value):
+            return self._serialize_dataclass(value)
         if isinstance(value, dict):
             return {k: self._normalize_paths(v) for k, v in value.items()}
         if isinstance(value, list):
@@ -131,87 +257,35 @@ class ConfigManager:
             config.scan_defaults = self._dict_to_scan_config(scan_defaults)
 
         ai_providers = raw.get("ai_providers", {})
+        load_provider = _build_loader(AIProviderConfig)
         for name, payload in ai_providers.items():
-            config.ai_providers[name] = AIProviderConfig(
-                provider_name=payload.get("provider_name", name),
-                api_key=payload.get("api_key"),
-                base_url=payload.get("base_url"),
-                timeout=payload.get("timeout", 30),
-                max_retries=payload.get("max_retries", 3),
-                enabled=payload.get("enabled", True),
-            )
+            config.ai_providers[name] = load_provider({"provider_name": name, **payload})
 
         user_prefs = raw.get("user_preferences")
         if user_prefs:
-            config.user_preferences = UserPreferences(
-                theme=user_prefs.get("theme", "dark"),
-                default_severity_filter=user_prefs.get(
-                    "default_severity_filter", ["high", "medium", "critical"]
-                ),
-                auto_save_reports=user_prefs.get("auto_save_reports", False),
-                max_history_items=user_prefs.get("max_history_items", 50),
-                language=user_prefs.get("language", "en"),
-                notification_settings=NotificationSettings(
-                    enable_toasts=user_prefs.get("notification_settings", {}).get("enable_toasts", True),
-                    enable_email_alerts=user_prefs.get("notification_settings", {}).get("enable_email_alerts", False),
-                    alert_level=user_prefs.get("notification_settings", {}).get("alert_level", "high"),
-                ),
-            )
+            config.user_preferences = _build_loader(UserPreferences)(user_prefs)
 
         export_settings = raw.get("export_settings")
         if export_settings:
-            config.export_settings = ExportSettings(
-                default_format=export_settings.get("default_format", "markdown"),
-                auto_attach_history=export_settings.get("auto_attach_history", False),
-                legacy_output_path=pathlib.Path(export_settings["legacy_output_path"])
-                if export_settings.get("legacy_output_path")
-                else None,
-            )
+            config.export_settings = _build_loader(ExportSettings)(export_settings)
 
         notification_settings = raw.get("notification_settings")
         if notification_settings:
-            config.notification_settings = NotificationSettings(
-                enable_toasts=notification_settings.get("enable_toasts", True),
-                enable_email_alerts=notification_settings.get("enable_email_alerts", False),
-                alert_level=notification_settings.get("alert_level", "high"),
-            )
+            config.notification_settings = _build_loader(NotificationSettings)(notification_settings)
 
         recent_projects = raw.get("recent_projects", [])
+        load_project = _build_loader(ProjectHistory)
         for entry in recent_projects:
             try:
-                config.recent_projects.append(
-                    ProjectHistory(
-                        project_path=pathlib.Path(entry.get("project_path", ".")),
-                        last_scan_date=entry.get("last_scan_date", datetime.utcnow().isoformat()),
-                        total_findings=entry.get("total_findings", 0),
-                        severity_breakdown=entry.get("severity_breakdown", {}),
-                        scan_count=entry.get("scan_count", 1),
-                    )
-                )
+                payload = {"project_path": ".", "total_findings": 0, "severity_breakdown": {}, **entry}
+                if "last_scan_date" not in payload:
+                    payload["last_scan_date"] = datetime.utcnow().isoformat()
+                config.recent_projects.append(load_project(payload))
             except Exception:
                 continue
 
         return config
 
     def _dict_to_scan_config(self, raw: Dict[str, Any]) -> ScanConfig:
-        scan_options_data = raw.get("scan_options", {})
-        scan_options = ScanOptions(
-            include_patterns=scan_options_data.get("include_patterns", ScanOptions().include_patterns),
-            exclude_patterns=scan_options_data.get("exclude_patterns", ScanOptions().exclude_patterns),
-            max_file_size=scan_options_data.get("max_file_size", 10485760),
-            scan_depth=scan_options_data.get("scan_depth"),
-            enable_entropy_analysis=scan_options_data.get(
-                "enable_entropy_analysis", True
-            ),
-            confidence_threshold=scan_options_data.get("confidence_threshold", 0.5),
-            enable_profiling=scan_options_data.get("enable_profiling", False),
-        )
-
-        return ScanConfig(
-            target_path=pathlib.Path(raw.get("target_path", ".")),
-            enable_ai=raw.get("enable_ai", False),
-            llm_provider=raw.get("llm_provider", "deepseek"),
-            output_format=raw.get("output_format", "gui_enhanced"),
-            scan_options=scan_options,
-            enable_debug=raw.get("enable_debug", False),
-        )
\ No newline at end of file
+        load: Callable[[Dict[str, Any]], ScanConfig] = _build_loader(ScanConfig)
+        return load({"target_path": ".", **raw})
\ No newline at end of file
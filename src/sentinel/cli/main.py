@@ -132,6 +132,16 @@ Environment Variables:
         OpenAI and LocalOllama are placeholder implementations for future development."""
     )
 
+    # Parallel scanning option
+    scan_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="""Number of worker processes for large scans (default: 1).
+        Values above 1 scan big file sets in a process pool."""
+    )
+
     # Output file option
     scan_parser.add_argument(
         "--output",
@@ -283,7 +293,7 @@ def run_scan(args) -> None:
         print(f"Scanning {len(files)} files...")
 
         # Run security rules
-        findings = run_rules(files)
+        findings = run_rules(files, max_workers=max(1, getattr(args, "jobs", 1)))
 
     # Apply AI enrichment if requested
     if args.ai or args.explain:
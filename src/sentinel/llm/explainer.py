@@ -9,7 +9,10 @@ SPDX-License-Identifier: MIT
 """
 
 import pathlib
-from typing import Dict, List, Optional, Union
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
 from sentinel.rules.base import Finding
 from sentinel.llm.provider import LLMProvider
@@ -17,6 +20,26 @@ from sentinel.llm.safety import SafetyLayer, sanitize_input, filter_sensitive_da
 from sentinel.llm.validation import OutputValidator, create_fallback_explanation
 
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+
+@lru_cache(maxsize=32)
+def _parse_template(template: str) -> Tuple[str, ...]:
+    """
+    Split a prompt template into literal and placeholder segments.
+    
+    Templates are reused for every finding, so the layout is parsed once per
+    unique template string and cached.
+    
+    Args:
+        template: The template string with {{variable}} placeholders
+        
+    Returns:
+        Tuple alternating literal text (even indexes) and placeholder names (odd indexes)
+    """
+    return tuple(_PLACEHOLDER_PATTERN.split(template))
+
+
 class ExplanationEngine:
     """
     Engine for generating AI-powered security explanations.
@@ -25,16 +48,18 @@ class ExplanationEngine:
     with graceful fallbacks to placeholder data.
     """
     
-    def __init__(self, prompts_dir: Optional[pathlib.Path] = None):
+    def __init__(self, prompts_dir: Optional[pathlib.Path] = None, max_workers: int = 4):
         """
         Initialize the explanation engine.
         
         Args:
             prompts_dir: Directory containing prompt templates. If None, uses default.
+            max_workers: Maximum number of rule groups explained concurrently in explain_batch
         """
         if prompts_dir is None:
             prompts_dir = pathlib.Path(__file__).parent / "prompts"
         self.prompts_dir = prompts_dir
+        self.max_workers = max(1, max_workers)
         self.safety_layer = SafetyLayer(max_excerpt_length=500, enable_filtering=True)
         self.validator = OutputValidator()
     
@@ -85,15 +110,25 @@ class ExplanationEngine:
         excerpt = finding.excerpt or "No excerpt available"
         safe_excerpt = self.safety_layer.process_for_ai(excerpt)
         
-        # Replace template variables
-        populated = template.replace("{{rule_id}}", finding.rule_id)
-        populated = populated.replace("{{severity}}", finding.severity)
-        populated = populated.replace("{{file_path}}", file_path_str)
-        populated = populated.replace("{{line}}", str(finding.line))
-        populated = populated.replace("{{excerpt}}", safe_excerpt)
-        populated = populated.replace("{{language}}", language)
-        populated = populated.replace("{{category}}", category)
-        populated = populated.replace("{{tags}}", tags_str)
+        values = {
+            "rule_id": finding.rule_id,
+            "severity": finding.severity,
+            "file_path": file_path_str,
+            "line": str(finding.line),
+            "excerpt": safe_excerpt,
+            "language": language,
+            "category": category,
+            "tags": tags_str,
+        }
+        
+        # Replace template variables in a single pass over the cached layout;
+        # unknown placeholders are left untouched
+        segments = _parse_template(template)
+        parts = list(segments)
+        for index in range(1, len(segments), 2):
+            name = segments[index]
+            parts[index] = values.get(name, "{{" + name + "}}")
+        populated = "".join(parts)
         
         return populated
     
@@ -333,22 +368,29 @@ class ExplanationEngine:
                 findings_by_rule[finding.rule_id] = []
             findings_by_rule[finding.rule_id].append(finding)
         
-        # Generate one explanation per rule type
+        # Generate one explanation per rule type, using the first finding of
+        # each group as representative. Provider calls are network-bound, so
+        # groups are explained concurrently; map() preserves group order.
+        representatives = [rule_findings[0] for rule_findings in findings_by_rule.values()]
+        worker_count = min(self.max_workers, len(representatives))
+        if worker_count > 1:
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                results = list(executor.map(
+                    lambda finding: self.explain_finding(finding, provider), representatives
+                ))
+        else:
+            results = [self.explain_finding(finding, provider) for finding in representatives]
+        
         explanations = {}
-        for rule_id, rule_findings in findings_by_rule.items():
-            if rule_findings:
-                # Use the first finding as representative for the batch
-                representative_finding = rule_findings[0]
-                explanation_data = self.explain_finding(representative_finding, provider)
-                
-                # Enhance the explanation to indicate it's a batch explanation
-                if len(rule_findings) > 1:
-                    # Safely handle string concatenation with type checking
-                    if isinstance(explanation_data["explanation"], str):
-                        explanation_data["explanation"] = f"[Batch explanation for {len(rule_findings)} findings] " + explanation_data["explanation"]
-                    if isinstance(explanation_data["remediation"], str):
-                        explanation_data["remediation"] = f"[Applies to {len(rule_findings)} instances] " + explanation_data["remediation"]
-                
-                explanations[rule_id] = explanation_data
+        for (rule_id, rule_findings), explanation_data in zip(findings_by_rule.items(), results):
+            # Enhance the explanation to indicate it's a batch explanation
+            if len(rule_findings) > 1:
+                # Safely handle string concatenation with type checking
+                if isinstance(explanation_data["explanation"], str):
+                    explanation_data["explanation"] = f"[Batch explanation for {len(rule_findings)} findings] " + explanation_data["explanation"]
+                if isinstance(explanation_data["remediation"], str):
+                    explanation_data["remediation"] = f"[Applies to {len(rule_findings)} instances] " + explanation_data["remediation"]
+            
+            explanations[rule_id] = explanation_data
         
         return explanations
\ No newline at end of file
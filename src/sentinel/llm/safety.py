@@ -12,6 +12,49 @@ import re
 from typing import Optional, Set
 
 
+# Common prompt injection attempts, compiled once at import time
+_INJECTION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'ignore.*previous.*instructions',
+        r'disregard.*previous',
+        r'you are now',
+        r'act as',
+        r'pretend you are',
+        r'forget.*rules',
+        r'break.*rules',
+        r'override.*system',
+        r'system.*override',
+        r'bypass.*safety',
+        r'security.*bypass',
+    )
+]
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
+
+# Common sensitive data patterns, compiled once at import time. Secrets are
+# ASCII, so re.ASCII keeps \b and character classes on the fast path.
+_SENSITIVE_PATTERNS = [
+    # API keys and tokens (generic patterns)
+    (re.compile(r'\b[A-Za-z0-9]{32,64}\b', re.ASCII), '[REDACTED_API_KEY]'),
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.ASCII), '[REDACTED_UUID]'),
+    (re.compile(r'\bgh[ops]_[A-Za-z0-9_]{36,255}\b', re.ASCII), '[REDACTED_GITHUB_TOKEN]'),
+    (re.compile(r'\bAKIA[0-9A-Z]{16}\b', re.ASCII), '[REDACTED_AWS_KEY]'),
+    (re.compile(r'\bsk-[A-Za-z0-9]{20,}\b', re.ASCII), '[REDACTED_OPENAI_KEY]'),
+    
+    # Email addresses
+    (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.ASCII), '[REDACTED_EMAIL]'),
+    
+    # IP addresses
+    (re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b', re.ASCII), '[REDACTED_IP]'),
+    
+    # URLs with sensitive parameters
+    (re.compile(r'https?://[^\s]*(?:token|key|password|secret)=[^&\s]+', re.ASCII), '[REDACTED_SENSITIVE_URL]'),
+]
+
+
 def sanitize_input(content: str) -> str:
     """
     Sanitize input content to prevent prompt injection and malicious input.
@@ -29,28 +72,14 @@ def sanitize_input(content: str) -> str:
     sanitized = content
     
     # Remove common prompt injection attempts
-    injection_patterns = [
-        r'ignore.*previous.*instructions',
-        r'disregard.*previous',
-        r'you are now',
-        r'act as',
-        r'pretend you are',
-        r'forget.*rules',
-        r'break.*rules',
-        r'override.*system',
-        r'system.*override',
-        r'bypass.*safety',
-        r'security.*bypass',
-    ]
-    
-    for pattern in injection_patterns:
-        sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE)
+    for pattern in _INJECTION_PATTERNS:
+        sanitized = pattern.sub('', sanitized)
     
     # Remove excessive whitespace that might be used for obfuscation
-    sanitized = re.sub(r'\s+', ' ', sanitized)
+    sanitized = _WHITESPACE_PATTERN.sub(' ', sanitized)
     
     # Remove control characters except basic whitespace
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', sanitized)
+    sanitized = _CONTROL_CHARS_PATTERN.sub('', sanitized)
     
     # Limit maximum length as additional safety measure
     sanitized = truncate_excerpt(sanitized, max_chars=2000)
@@ -78,14 +107,15 @@ def truncate_excerpt(excerpt: str, max_chars: int = 500) -> str:
     # Truncate and add ellipsis, trying to break at a word boundary
     # Ensure total length doesn't exceed max_chars including ellipsis
     max_content_chars = max_chars - 3  # Reserve 3 chars for "..."
-    truncated = excerpt[:max_content_chars]
-    
-    # Find the last space to break at word boundary
-    last_space = truncated.rfind(' ')
-    if last_space > max_content_chars * 0.8:  # Only if we have a reasonable break point
-        truncated = truncated[:last_space]
-    
-    return truncated + "..."
+
+    # Find the last space to break at word boundary, only searching the tail
+    # window where a break point is reasonable (last 20% of the content)
+    min_break = int(max_content_chars * 0.8) + 1
+    last_space = excerpt.rfind(' ', min_break, max_content_chars)
+    if last_space > 0:
+        return excerpt[:last_space] + "..."
+
+    return excerpt[:max_content_chars] + "..."
 
 
 def filter_sensitive_data(content: str) -> str:
@@ -103,27 +133,8 @@ def filter_sensitive_data(content: str) -> str:
     
     filtered = content
     
-    # Common sensitive data patterns
-    sensitive_patterns = {
-        # API keys and tokens (generic patterns)
-        r'\b[A-Za-z0-9]{32,64}\b': '[REDACTED_API_KEY]',
-        r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b': '[REDACTED_UUID]',
-        r'\bgh[ops]_[A-Za-z0-9_]{36,255}\b': '[REDACTED_GITHUB_TOKEN]',
-        r'\bAKIA[0-9A-Z]{16}\b': '[REDACTED_AWS_KEY]',
-        r'\bsk-[A-Za-z0-9]{20,}\b': '[REDACTED_OPENAI_KEY]',
-        
-        # Email addresses
-        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b': '[REDACTED_EMAIL]',
-        
-        # IP addresses
-        r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b': '[REDACTED_IP]',
-        
-        # URLs with sensitive parameters
-        r'https?://[^\s]*(?:token|key|password|secret)=[^&\s]+': '[REDACTED_SENSITIVE_URL]',
-    }
-    
-    for pattern, replacement in sensitive_patterns.items():
-        filtered = re.sub(pattern, replacement, filtered)
+    for pattern, replacement in _SENSITIVE_PATTERNS:
+        filtered = pattern.sub(replacement, filtered)
     
     return filtered
 
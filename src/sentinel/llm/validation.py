@@ -9,7 +9,56 @@ SPDX-License-Identifier: MIT
 """
 
 import re
-from typing import Dict, List, Optional, Union, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union, Any
+
+
+_CWE_PATTERN = re.compile(r'^CWE-(\d+)$')
+
+# Required AI output fields mapped to their accepted (non-None) types and the
+# error reported when the type check fails
+_FIELD_TYPES: Dict[str, Tuple[Union[type, Tuple[type, ...]], str]] = {
+    "explanation": (str, "Explanation must be a string or None"),
+    "cwe_id": (str, "CWE ID must be a string or None"),
+    "remediation": (str, "Remediation must be a string or None"),
+    "risk_score": ((float, int), "Risk score must be a number or None"),
+    "references": (list, "References must be a list or None"),
+}
+
+# Static parts of the fallback explanation; references are copied per call so
+# callers can mutate the returned list
+_FALLBACK_REMEDIATION = "Please review the security finding manually and consult security documentation."
+_FALLBACK_REFERENCES = (
+    "https://cwe.mitre.org/",
+    "https://owasp.org/www-project-top-ten/",
+)
+
+# Marks a required field that is absent, as opposed to present but None
+_MISSING = object()
+
+_REFERENCE_URL_SCHEMES = ("http://", "https://")
+
+_REFERENCE_URL_PATTERN = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+# Suspicious or malicious content in references, combined into a single
+# alternation so each reference is scanned once
+_SUSPICIOUS_CONTENT_PATTERN = re.compile(
+    '|'.join([
+        r'<script>',
+        r'javascript:',
+        r'vbscript:',
+        r'eval\(',
+        r'exec\(',
+        r'import\s+os',
+        r'import\s+sys',
+        r'__import__',
+        r'subprocess',
+        r'os\.system',
+        r'execfile',
+        r'compile\(',
+    ]),
+    re.IGNORECASE,
+)
 
 
 def validate_ai_output(data: Dict[str, Any]) -> bool:
@@ -25,27 +74,13 @@ def validate_ai_output(data: Dict[str, Any]) -> bool:
     if not isinstance(data, dict):
         return False
     
-    # Required fields check
-    required_fields = ["explanation", "cwe_id", "remediation", "risk_score", "references"]
-    for field in required_fields:
+    # Required fields and type check (None is allowed for every field)
+    for field, (field_type, _) in _FIELD_TYPES.items():
         if field not in data:
             return False
-    
-    # Type validation
-    if not isinstance(data.get("explanation"), (str, type(None))):
-        return False
-    
-    if not isinstance(data.get("cwe_id"), (str, type(None))):
-        return False
-    
-    if not isinstance(data.get("remediation"), (str, type(None))):
-        return False
-    
-    if not isinstance(data.get("risk_score"), (float, int, type(None))):
-        return False
-    
-    if not isinstance(data.get("references"), (list, type(None))):
-        return False
+        value = data[field]
+        if value is not None and not isinstance(value, field_type):
+            return False
     
     # Content validation for non-None values
     explanation = data.get("explanation")
@@ -80,21 +115,28 @@ def validate_cwe_format(cwe_id: str) -> bool:
     if not isinstance(cwe_id, str):
         return False
     
-    # CWE format: CWE- followed by digits
-    cwe_pattern = r'^CWE-\d+$'
-    if not re.match(cwe_pattern, cwe_id):
-        return False
+    return _is_valid_cwe_string(cwe_id)
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_cwe_string(cwe_id: str) -> bool:
+    """
+    Check a CWE identifier string, memoized since scans reuse a small set of CWEs.
     
-    # Extract CWE number and validate range
-    try:
-        cwe_number = int(cwe_id.split('-')[1])
-        # CWE numbers typically range from 1 to 1000+, but we'll set reasonable bounds
-        if cwe_number < 1 or cwe_number > 9999:
-            return False
-    except (ValueError, IndexError):
+    Args:
+        cwe_id: CWE identifier string to check
+        
+    Returns:
+        True if the CWE format is valid, False otherwise
+    """
+    # CWE format: CWE- followed by digits
+    match = _CWE_PATTERN.match(cwe_id)
+    if not match:
         return False
     
-    return True
+    # CWE numbers typically range from 1 to 1000+, but we'll set reasonable bounds
+    cwe_number = int(match.group(1))
+    return 1 <= cwe_number <= 9999
 
 
 def validate_risk_score(risk_score: Union[float, int]) -> bool:
@@ -201,25 +243,14 @@ def _validate_reference_url(url: str) -> bool:
     Returns:
         True if URL format is valid, False otherwise
     """
-    # Basic URL pattern check
-    url_pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    if not re.match(url_pattern, url, re.IGNORECASE):
+    # Cheap scheme check first; javascript:, data:, file: and similar
+    # references are rejected without running the URL regex
+    if not url[:8].lower().startswith(_REFERENCE_URL_SCHEMES):
         return False
     
-    # Check for common security reference domains
-    allowed_domains = [
-        'cwe.mitre.org',
-        'nvd.nist.gov',
-        'owasp.org',
-        'sans.org',
-        'security.stackexchange.com',
-        'github.com',
-        'gitlab.com',
-        'docs.python.org',
-        'docs.oracle.com',
-        'developer.mozilla.org',
-        'w3.org',
-    ]
+    # Basic URL pattern check
+    if not _REFERENCE_URL_PATTERN.match(url):
+        return False
     
     # Allow any domain for now, but we could restrict to known security sources
     # This is a placeholder for future domain filtering
@@ -236,26 +267,7 @@ def _contains_suspicious_content(text: str) -> bool:
     Returns:
         True if suspicious content is found, False otherwise
     """
-    suspicious_patterns = [
-        r'<script>',
-        r'javascript:',
-        r'vbscript:',
-        r'eval\(',
-        r'exec\(',
-        r'import\s+os',
-        r'import\s+sys',
-        r'__import__',
-        r'subprocess',
-        r'os\.system',
-        r'execfile',
-        r'compile\(',
-    ]
-    
-    for pattern in suspicious_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    
-    return False
+    return _SUSPICIOUS_CONTENT_PATTERN.search(text) is not None
 
 
 def create_fallback_explanation(finding_id: str, validation_errors: List[str]) -> Dict[str, Any]:
@@ -274,12 +286,9 @@ def create_fallback_explanation(finding_id: str, validation_errors: List[str]) -
     return {
         "explanation": f"AI explanation validation failed for finding {finding_id}. Errors: {error_summary}",
         "cwe_id": None,
-        "remediation": "Please review the security finding manually and consult security documentation.",
+        "remediation": _FALLBACK_REMEDIATION,
         "risk_score": None,
-        "references": [
-            "https://cwe.mitre.org/",
-            "https://owasp.org/www-project-top-ten/"
-        ],
+        "references": list(_FALLBACK_REFERENCES),
     }
 
 
@@ -308,13 +317,15 @@ class OutputValidator:
         Returns:
             Validated and potentially fixed explanation data
         """
-        validation_errors = self._get_validation_errors(data)
-        
-        if not validation_errors:
+        # Fast path: valid output is the common case, so check it with the
+        # short-circuiting validator and only enumerate errors on failure
+        if validate_ai_output(data):
             return data
         
+        # Error messages only feed the fallback explanation, so they are not
+        # collected at all when fallback is disabled
         if self.enable_fallback:
-            return create_fallback_explanation(finding_id, validation_errors)
+            return create_fallback_explanation(finding_id, self._get_validation_errors(data))
         
         # If fallback is disabled and validation fails, return minimal safe data
         return {
@@ -335,47 +346,37 @@ class OutputValidator:
         Returns:
             List of validation error messages
         """
-        errors = []
-        
-        if not isinstance(data, dict):
+        try:
+            get = data.get
+        except AttributeError:
             return ["Data must be a dictionary"]
         
-        # Check required fields
-        required_fields = ["explanation", "cwe_id", "remediation", "risk_score", "references"]
-        for field in required_fields:
-            if field not in data:
+        # Check required fields and types in one pass, reporting missing
+        # fields ahead of type errors
+        errors = []
+        type_errors = []
+        for field, (field_type, message) in _FIELD_TYPES.items():
+            value = get(field, _MISSING)
+            if value is _MISSING:
                 errors.append(f"Missing required field: {field}")
-        
-        # Type validation with specific error messages
-        if "explanation" in data and not isinstance(data["explanation"], (str, type(None))):
-            errors.append("Explanation must be a string or None")
-        
-        if "cwe_id" in data and not isinstance(data["cwe_id"], (str, type(None))):
-            errors.append("CWE ID must be a string or None")
-        
-        if "remediation" in data and not isinstance(data["remediation"], (str, type(None))):
-            errors.append("Remediation must be a string or None")
-        
-        if "risk_score" in data and not isinstance(data["risk_score"], (float, int, type(None))):
-            errors.append("Risk score must be a number or None")
-        
-        if "references" in data and not isinstance(data["references"], (list, type(None))):
-            errors.append("References must be a list or None")
+            elif value is not None and not isinstance(value, field_type):
+                type_errors.append(message)
+        errors.extend(type_errors)
         
         # Content validation with proper type handling
-        explanation = data.get("explanation")
+        explanation = get("explanation")
         if explanation is not None and not _validate_explanation_content(explanation):
             errors.append("Explanation content validation failed")
         
-        cwe_id = data.get("cwe_id")
+        cwe_id = get("cwe_id")
         if cwe_id is not None and not validate_cwe_format(cwe_id):
             errors.append(f"Invalid CWE format: {cwe_id}")
         
-        risk_score = data.get("risk_score")
+        risk_score = get("risk_score")
         if risk_score is not None and not validate_risk_score(risk_score):
             errors.append(f"Risk score out of range: {risk_score}")
         
-        references = data.get("references")
+        references = get("references")
         if references is not None and not validate_references(references):
             errors.append("References validation failed")
         
@@ -8,10 +8,20 @@ SPDX-License-Identifier: MIT
 """
 
 import json
+from collections import Counter
 from typing import List, Dict, Any
 
 from sentinel.rules.base import Finding
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+# Severities summarized in the report, in output order
+_SUMMARY_SEVERITIES = ("critical", "high", "medium", "low")
+
 
 def generate_json_report(findings: List[Finding]) -> str:
     """
@@ -31,6 +41,7 @@ def generate_json_report(findings: List[Finding]) -> str:
             "scan_summary": {
                 "total_findings": 2,
                 "by_severity": {
+                    "critical": 0,
                     "high": 1,
                     "medium": 1,
                     "low": 0
@@ -39,11 +50,9 @@ def generate_json_report(findings: List[Finding]) -> str:
             "findings": [...]
         }
     """
-    # Build scan summary
-    severity_counts = {"high": 0, "medium": 0, "low": 0}
-
-    for finding in findings:
-        severity_counts[finding.severity] += 1
+    # Build scan summary; Counter tallies severities in C
+    counts = Counter(finding.severity for finding in findings)
+    severity_counts = {severity: counts[severity] for severity in _SUMMARY_SEVERITIES}
 
     scan_summary = {
         "total_findings": len(findings),
@@ -69,4 +78,6 @@ def generate_json_report(findings: List[Finding]) -> str:
         "findings": findings_data
     }
 
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode("utf-8")
     return json.dumps(report, indent=2, ensure_ascii=False)
@@ -12,6 +12,12 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional, List, Protocol, Dict, Any
 import pathlib
+import sys
+
+
+# Findings are created in bulk on large scans; slotted instances drop the
+# per-instance __dict__. dataclass(slots=True) needs Python 3.10+.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 @dataclass
@@ -63,7 +69,7 @@ class RuleMeta:
     """Priority for AI explanation generation."""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Finding:
     """
     Normalized finding object for security issues.
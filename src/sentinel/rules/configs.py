@@ -14,6 +14,10 @@ from typing import List, Dict
 
 from sentinel.rules.base import Finding, RuleMeta, create_default_rule_meta
 from sentinel.rules.token_types import classify_token, TokenType
+from sentinel.utils.patterns import compile_alternation, contains_any
+
+
+_QUOTED_VALUE_PATTERN = re.compile(r'["\']([^"\']+)["\']')
 
 
 # TODO: Phase 2 - Add CWE mapping for hardcoded API keys (CWE-798)
@@ -55,10 +59,22 @@ class HardcodedAPIRule:
         "slack_token": r'["\'](xox[pbar]-[0-9]{12}-[0-9]{12}-[0-9]{12}-[a-z0-9]{32})["\']',
     }
 
-    def __init__(self):
-        """Initialize the rule with compiled patterns."""
-        import sentinel.utils.patterns as patterns_module
-        self.compiled_patterns = patterns_module.compile_patterns(self.API_KEY_PATTERNS)
+    # Patterns whose match is the token itself rather than an assignment
+    TOKEN_PATTERN_IDS = frozenset({
+        "stripe_secret_key", "stripe_restricted_key", "aws_access_key",
+        "github_token", "slack_token",
+    })
+
+    # Lowercase substrings at least one of which every pattern above requires;
+    # content containing none of them cannot match and skips the regex scan
+    REQUIRED_SUBSTRINGS = (
+        "api", "secret", "token", "password", "sk_", "rk_", "akia",
+        "ghp_", "gho_", "ghs_", "xox",
+    )
+
+    # All patterns combined into one alternation, compiled once with the class and
+    # shared by every instance
+    combined_pattern = compile_alternation(API_KEY_PATTERNS)
 
     def apply(self, path: pathlib.Path, text: str) -> List[Finding]:
         """
@@ -72,34 +88,46 @@ class HardcodedAPIRule:
             List of Finding objects for detected API keys
         """
         findings: List[Finding] = []
-        lines = text.split('\n')
-
-        for line_num, line in enumerate(lines, 1):
-            import sentinel.utils.patterns as patterns_module
-            matches = patterns_module.match_patterns(line, self.compiled_patterns)
+        if not contains_any(text, self.REQUIRED_SUBSTRINGS):
+            return findings
+
+        line_num = 1
+        line_start = 0
+        pos = 0
+
+        # A match within a single line is also a match in the whole text, so a
+        # search over the whole text jumps straight to the next line that can
+        # match instead of splitting the file and searching every line
+        while True:
+            candidate = self.combined_pattern.search(text, pos)
+            if candidate is None:
+                break
+
+            next_line_start = text.rfind('\n', 0, candidate.start()) + 1
+            line_num += text.count('\n', line_start, next_line_start)
+            line_start = next_line_start
+            line_end = text.find('\n', candidate.start())
+            if line_end == -1:
+                line_end = len(text)
+            pos = line_end + 1
+
+            # The whole-text match may span lines, so confirm it on the line itself
+            line = text[line_start:line_end]
+            match = self.combined_pattern.search(line)
 
             # Only create one finding per line, even if multiple patterns match
-            if matches:
+            if match:
                 # Extract the actual token value for classification
                 token_value = None
-                for pattern_match in matches:
-                    # Extract the captured group (the actual token)
-                    if pattern_match.pattern_id in ["stripe_secret_key", "stripe_restricted_key", 
-                                                  "aws_access_key", "github_token", "slack_token"]:
-                        # Extract the token from matched_text using regex
-                        token_match = re.search(r'["\']([^"\']+)["\']', pattern_match.matched_text)
-                        if token_match:
-                            token_value = token_match.group(1)
-                    else:
-                        # For assignment patterns, extract the value
-                        assignment_patterns = ["api_key_assignment", "secret_key_assignment", 
-                                             "token_assignment", "password_assignment"]
-                        if pattern_match.pattern_id in assignment_patterns:
-                            # Extract the value inside quotes
-                            quote_match = re.search(r'["\']([^"\']+)["\']', line)
-                            if quote_match:
-                                token_value = quote_match.group(1)
-                    break  # Only process first match per line
+                if match.lastgroup in self.TOKEN_PATTERN_IDS:
+                    # Extract the token from the text around the match
+                    context = line[max(0, match.start() - 100):match.end() + 100]
+                    token_match = _QUOTED_VALUE_PATTERN.search(context)
+                else:
+                    # For assignment patterns, extract the value inside quotes
+                    token_match = _QUOTED_VALUE_PATTERN.search(line)
+                if token_match:
+                    token_value = token_match.group(1)
 
                 # Skip if this token is already classified by a more specific secret rule
                 if token_value:
@@ -152,19 +180,22 @@ class HardcodedDatabaseRule:
         ai_explanation_priority="high"
     )
 
-    # Database connection patterns
+    # Database connection patterns. None of them can match across a newline,
+    # so the whole file is scanned at once and matches map onto single lines.
     DATABASE_PATTERNS = {
-        "postgres_connection": r'\bpostgres(ql)?://[^:]+:[^@]+@[^"\'\s]+',
-        "mysql_connection": r'\bmysql://[^:]+:[^@]+@[^"\'\s]+',
-        "mongodb_connection": r'\bmongodb(\+srv)?://[^:]+:[^@]+@[^"\'\s]+',
-        "redis_connection": r'\bredis://[^:]+:[^@]+@[^"\'\s]+',
-        "database_credential_block": r'\bhost\s*[=:]\s*["\'][^"\']+["\']\s*,\s*port\s*[=:]\s*["\'][^"\']+["\']\s*,\s*(user|username)\s*[=:]\s*["\'][^"\']+["\']\s*,\s*(password|pass)\s*[=:]\s*["\'][^"\']+["\']',
+        "postgres_connection": r'\bpostgres(ql)?://[^:\n]+:[^@\n]+@[^"\'\s]+',
+        "mysql_connection": r'\bmysql://[^:\n]+:[^@\n]+@[^"\'\s]+',
+        "mongodb_connection": r'\bmongodb(\+srv)?://[^:\n]+:[^@\n]+@[^"\'\s]+',
+        "redis_connection": r'\bredis://[^:\n]+:[^@\n]+@[^"\'\s]+',
+        "database_credential_block": r'\bhost[^\S\n]*[=:][^\S\n]*["\'][^"\'\n]+["\'][^\S\n]*,[^\S\n]*port[^\S\n]*[=:][^\S\n]*["\'][^"\'\n]+["\'][^\S\n]*,[^\S\n]*(user|username)[^\S\n]*[=:][^\S\n]*["\'][^"\'\n]+["\'][^\S\n]*,[^\S\n]*(password|pass)[^\S\n]*[=:][^\S\n]*["\'][^"\'\n]+["\']',
     }
 
-    def __init__(self):
-        """Initialize the rule with compiled patterns."""
-        import sentinel.utils.patterns as patterns_module
-        self.compiled_patterns = patterns_module.compile_patterns(self.DATABASE_PATTERNS)
+    # Lowercase substrings at least one of which every pattern above requires
+    REQUIRED_SUBSTRINGS = ("://", "host")
+
+    # All patterns combined into one alternation, compiled once with the class and
+    # shared by every instance
+    combined_pattern = compile_alternation(DATABASE_PATTERNS)
 
     def apply(self, path: pathlib.Path, text: str) -> List[Finding]:
         """
@@ -178,28 +209,38 @@ class HardcodedDatabaseRule:
             List of Finding objects for detected database credentials
         """
         findings: List[Finding] = []
-        lines = text.split('\n')
+        if not contains_any(text, self.REQUIRED_SUBSTRINGS):
+            return findings
 
-        for line_num, line in enumerate(lines, 1):
-            import sentinel.utils.patterns as patterns_module
-            matches = patterns_module.match_patterns(line, self.compiled_patterns)
+        line_num = 1
+        line_start = 0
+        line_end = -1
 
+        for match in self.combined_pattern.finditer(text):
             # Only create one finding per line, even if multiple patterns match
-            if matches:
-                # Create excerpt (truncate if too long)
-                excerpt = line.strip()
-                if len(excerpt) > 100:
-                    excerpt = excerpt[:97] + "..."
-
-                finding = Finding(
-                    rule_id=self.id,
-                    file_path=path,
-                    line=line_num,
-                    severity=self.severity,
-                    excerpt=excerpt,
-                    confidence=0.9  # Very high confidence for connection strings
-                )
-                findings.append(finding)
+            if match.start() <= line_end:
+                continue
+
+            line_num += text.count('\n', line_start, match.start())
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            line_end = text.find('\n', match.end())
+            if line_end == -1:
+                line_end = len(text)
+
+            # Create excerpt (truncate if too long)
+            excerpt = text[line_start:line_end].strip()
+            if len(excerpt) > 100:
+                excerpt = excerpt[:97] + "..."
+
+            finding = Finding(
+                rule_id=self.id,
+                file_path=path,
+                line=line_num,
+                severity=self.severity,
+                excerpt=excerpt,
+                confidence=0.9  # Very high confidence for connection strings
+            )
+            findings.append(finding)
 
         return findings
 
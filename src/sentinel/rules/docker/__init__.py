@@ -1,15 +1,34 @@
 import re
 import pathlib
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from sentinel.rules.base import Finding
 from sentinel.rules.token_types import classify_token, TokenType
 from sentinel.utils.parsers import parse_dockerfile
+from sentinel.utils.patterns import contains_any
 
 
+_DOCKERFILE_SUFFIXES = ("Dockerfile", "Dockerfile.build")
+
+
+@lru_cache(maxsize=8192)
 def is_dockerfile(filepath: str) -> bool:
-    """Return True if the path likely points to a Dockerfile."""
-    return filepath.endswith("Dockerfile") or filepath.endswith("Dockerfile.build")
+    """Return True if the path likely points to a Dockerfile.
+
+    Memoized because every Docker rule asks the same question for each file.
+    """
+    return filepath.endswith(_DOCKERFILE_SUFFIXES)
+
+
+@lru_cache(maxsize=16)
+def _parse_instructions(text: str) -> Tuple[Tuple[str, str, int], ...]:
+    """Parse Dockerfile content once and share the result across Docker rules.
+
+    The engine hands every rule the same content string for a file, so the
+    second rule's lookup is a cache hit on an already-hashed string.
+    """
+    return tuple(parse_dockerfile(text))
 
 
 class RunningAsRootRule:
@@ -28,15 +47,18 @@ class RunningAsRootRule:
         if not is_dockerfile(str(path)):
             return []
 
-        instructions = parse_dockerfile(text)
+        instructions = _parse_instructions(text)
         last_user_line: Optional[int] = None
         last_user_was_root = False
 
-        for instruction, arguments, line_num in instructions:
+        # Only the final USER instruction matters, so walk backwards and stop
+        # at the first one instead of visiting every instruction
+        for instruction, arguments, line_num in reversed(instructions):
             if instruction == "USER":
                 normalized = arguments.strip().lower()
                 last_user_line = line_num
                 last_user_was_root = normalized == "root"
+                break
 
         if last_user_line and last_user_was_root:
             return [
@@ -71,13 +93,19 @@ class HardcodedSecretsInENVRule:
     _secret_prefix_pattern = re.compile(
         r"((?:AKIA|ghp_|ya29|sk_live|pk_live)[A-Za-z0-9_/\+\-]{15,})", re.IGNORECASE
     )
+    # Lowercase literal prefixes of _secret_prefix_pattern; a Dockerfile that
+    # contains none of them cannot produce a finding
+    _secret_prefixes = ("akia", "ghp_", "ya29", "sk_live", "pk_live")
 
     def apply(self, path: pathlib.Path, text: str) -> List[Finding]:
         if not is_dockerfile(str(path)):
             return []
 
+        if not contains_any(text, self._secret_prefixes):
+            return []
+
         findings: List[Finding] = []
-        instructions = parse_dockerfile(text)
+        instructions = _parse_instructions(text)
 
         for instruction, arguments, line_num in instructions:
             if instruction != "ENV" or "=" not in arguments:
@@ -1,14 +1,21 @@
 import re
 import pathlib
+from functools import lru_cache
 from typing import List, Optional
 
 from sentinel.rules.base import Finding
 from sentinel.utils.parsers import get_yaml_key_value
 
 
+@lru_cache(maxsize=8192)
 def is_gha_workflow(filepath: str) -> bool:
-    """Return True if the file path is likely a GitHub Actions workflow."""
-    return ".github/workflows/" in filepath and filepath.endswith((".yml", ".yaml"))
+    """Return True if the file path is likely a GitHub Actions workflow.
+
+    Memoized because every GHA rule asks the same question for each file.
+    """
+    if not filepath.endswith((".yml", ".yaml")):
+        return False
+    return ".github/workflows/" in filepath.replace("\\", "/")
 
 
 def _leading_blank_line_count(text: str) -> int:
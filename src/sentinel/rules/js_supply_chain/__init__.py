@@ -1,14 +1,30 @@
 import re
 import pathlib
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from sentinel.rules.base import Finding
 from sentinel.utils.parsers import parse_json
 
 
+@lru_cache(maxsize=8192)
 def is_package_json(filepath: str) -> bool:
-    """Return True if path ends with package.json."""
-    return filepath.endswith("package.json")
+    """Return True if the file name is exactly package.json.
+
+    Memoized because every JSC rule asks the same question for each file.
+    """
+    return filepath == "package.json" or filepath.endswith(("/package.json", "\\package.json"))
+
+
+@lru_cache(maxsize=16)
+def _parse_package_json(text: str) -> Optional[Dict[str, Any]]:
+    """Parse package.json content once and share the result across JSC rules.
+
+    The engine hands every rule the same content string for a file, so the
+    second rule's lookup is a cache hit. Callers must treat the result as
+    read-only since it is shared.
+    """
+    return parse_json(text)
 
 
 class MaliciousPackageScriptHooksRule:
@@ -33,7 +49,7 @@ class MaliciousPackageScriptHooksRule:
         if not is_package_json(str(path)):
             return []
 
-        package_data = parse_json(text)
+        package_data = _parse_package_json(text)
         if not package_data or "scripts" not in package_data:
             return []
 
@@ -74,7 +90,7 @@ class WildcardDependencyVersionRule:
         if not is_package_json(str(path)):
             return []
 
-        package_data = parse_json(text)
+        package_data = _parse_package_json(text)
         if not package_data:
             return []
 
@@ -12,15 +12,28 @@ import importlib
 import inspect
 import pathlib
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Optional, Protocol, Type, Any, Dict, Tuple
 import logging
 
 from sentinel.rules.base import Finding, Rule
-from sentinel.rules.token_types import TokenType, classify_token
+from sentinel.rules.token_types import TokenType
 
 
 logger = logging.getLogger(__name__)
 
+# Scans with fewer files than this stay in-process; spawning workers and
+# loading rules in each of them only pays off on larger file sets
+PARALLEL_MIN_FILES = 64
+
+# Files handed to a worker per task, amortizing IPC overhead
+PARALLEL_CHUNK_SIZE = 32
+
+# Rules loaded once per worker process by _init_worker
+_worker_rules: List[Rule] = []
+
 
 class RuleLoader:
     """
@@ -274,89 +287,57 @@ class RuleLoader:
         return True
 
 
-def _get_rule_precedence(finding: Finding) -> int:
-    """
-    Determine precedence score for a finding based on rule type and token classification.
-    
-    Higher precedence values take priority during deduplication.
-    """
-    # Check if precedence is explicitly set on the finding (Phase 2.7 addition)
-    if finding.rule_precedence is not None:
-        return finding.rule_precedence
-        
-    # Fallback to logic used before explicit precedence fields were mandatory
-    
-    # Extract token from excerpt for classification
-    excerpt = finding.excerpt or ""
-    token = _extract_token_from_excerpt(excerpt)
-    token_type = classify_token(token) if token else None
-    
+# Precedence by rule_id for findings that carry no explicit precedence
+_RULE_PRECEDENCE: Dict[str, int] = {
     # Provider-specific rules have highest precedence
-    provider_specific_rules = {
+    **dict.fromkeys((
         'SECRET_AWS_ACCESS_KEY', 'SECRET_AWS_SECRET_KEY', 'SECRET_GCP_SERVICE_ACCOUNT',
         'SECRET_AZURE_CLIENT_SECRET', 'SECRET_STRIPE_API_KEY', 'SECRET_JWT',
         'SECRET_PRIVATE_KEY', 'SECRET_SLACK_BOT_TOKEN', 'SECRET_SLACK_USER_TOKEN',
         'SECRET_GITHUB_TOKEN', 'SECRET_FACEBOOK_ACCESS_TOKEN'
-    }
-    
-    if finding.rule_id in provider_specific_rules:
-        return 100  # Highest precedence for provider-specific
-    
+    ), 100),
     # OAuth tokens and hardcoded passwords
-    if finding.rule_id in {'SECRET_OAUTH_TOKEN', 'SECRET_HARDCODED_PASSWORD'}:
-        return 90
-    
+    **dict.fromkeys(('SECRET_OAUTH_TOKEN', 'SECRET_HARDCODED_PASSWORD'), 90),
     # Generic API keys
-    if finding.rule_id in {'SECRET_GENERIC_API_KEY', 'hardcoded-api-key'}:
-        return 80
-    
+    **dict.fromkeys(('SECRET_GENERIC_API_KEY', 'hardcoded-api-key'), 80),
     # High entropy strings (lowest precedence for secrets)
-    if finding.rule_id == 'SECRET_HIGH_ENTROPY':
-        return 70
-        
-    # Specialized Misconfiguration rules (Phase 2.7) - We hardcode this here 
-    # to maintain backward compatibility for Phase 2.5 core rules (60)
-    # Since Phase 2.7 rules explicitly set precedence=65, this branch is mainly for Phase 2.5
-    # config rules which do not have the 'precedence' attribute on the finding.
-    
-    # Configuration rules (separate category, Phase 2.5 era)
-    config_rules = {
+    'SECRET_HIGH_ENTROPY': 70,
+    # Configuration rules (separate category, Phase 2.5 era). Phase 2.7
+    # specialized misconfiguration rules set precedence=65 explicitly, so this
+    # mainly covers Phase 2.5 config rules whose findings carry no precedence.
+    **dict.fromkeys((
         'insecure-bind', 'debug-enabled', 'weak-crypto', 'exposed-env-vars',
         'insecure-literals', 'development-settings', 'tls-issues', 'hardcoded-database'
-    }
-    if finding.rule_id in config_rules:
-        return 60
-    
-    # Default precedence for unknown rules
-    return 50
+    ), 60),
+}
+
+# Default precedence for unknown rules
+_DEFAULT_RULE_PRECEDENCE = 50
 
 
-def _extract_token_from_excerpt(excerpt: str) -> Optional[str]:
+def _get_rule_precedence(finding: Finding) -> int:
     """
-    Extract potential token value from excerpt for classification.
+    Determine precedence score for a finding based on its rule.
+    
+    Higher precedence values take priority during deduplication.
     """
-    if not excerpt:
-        return None
+    # Check if precedence is explicitly set on the finding (Phase 2.7 addition)
+    if finding.rule_precedence is not None:
+        return finding.rule_precedence
         
-    # Look for common assignment patterns
-    patterns = [
-        r'[\'"]([A-Za-z0-9+/=\-_\.]{16,})[\'"]',  # Quoted strings
-        r'=\s*([A-Za-z0-9+/=\-_\.]{16,})\s*',     # Assignment without quotes
-        r':\s*[\'"]([A-Za-z0-9+/=\-_\.]{16,})[\'"]',  # YAML-style
-    ]
-    
-    import re
-    for pattern in patterns:
-        match = re.search(pattern, excerpt)
-        if match:
-            return match.group(1)
-    
-    # Fallback: look for any long alphanumeric string
-    long_strings = re.findall(r'\b[A-Za-z0-9+/=\-_\.]{16,}\b', excerpt)
-    if long_strings:
-        return long_strings[0]
-    
-    return None
+    # Fallback to the rule-id table used before explicit precedence fields
+    # were mandatory
+    return _RULE_PRECEDENCE.get(finding.rule_id, _DEFAULT_RULE_PRECEDENCE)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_excerpt(excerpt: str) -> str:
+    """
+    Collapse whitespace runs in an excerpt to single spaces.
+
+    Memoized because every rule that fires on a line produces the same excerpt.
+    """
+    return ' '.join(excerpt.split())
 
 
 def _get_finding_group_key(finding: Finding) -> Tuple[str, int, str]:
@@ -370,45 +351,62 @@ def _get_finding_group_key(finding: Finding) -> Tuple[str, int, str]:
     line_number = finding.line or 0
     
     # Normalize excerpt by removing extra whitespace, use empty string for None
-    excerpt = finding.excerpt or ""
-    normalized_excerpt = ' '.join(excerpt.strip().split())
+    normalized_excerpt = _normalize_excerpt(finding.excerpt or "")
     
     return (file_path, line_number, normalized_excerpt)
 
 
+def _finding_rank(finding: Finding) -> Tuple[int, float, str]:
+    """
+    Rank a finding for deduplication: precedence, then confidence, then rule_id.
+
+    Higher ranks win; rule_id gives a deterministic tie-break.
+    """
+    # Same result as _get_rule_precedence, inlined since this runs once per finding
+    precedence = finding.rule_precedence
+    if precedence is None:
+        precedence = _RULE_PRECEDENCE.get(finding.rule_id, _DEFAULT_RULE_PRECEDENCE)
+    return (precedence, finding.confidence or 0.0, finding.rule_id)
+
+
 def _deduplicate_findings(findings: List[Finding]) -> List[Finding]:
     """
     Deduplicate findings by keeping only the highest-precedence finding per group.
+
+    Single pass: each group keeps only its current best finding and rank, so no
+    per-group lists are built or sorted. On equal ranks the earlier finding
+    wins, and groups keep the order of their first finding.
     """
     if not findings:
         return []
     
-    # Group findings by file/line/excerpt
-    grouped_findings: Dict[Tuple[str, int, str], List[Finding]] = {}
+    # Best (rank, finding) so far per file/line/excerpt group
+    best: Dict[Tuple[str, int, str], Tuple[Tuple[int, float, str], Finding]] = {}
+    get_best = best.get
+    
+    # Group sizes are only needed for debug logging; counting them in the
+    # main loop keeps group key construction to once per finding
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    group_sizes: Counter = Counter()
     
     for finding in findings:
         group_key = _get_finding_group_key(finding)
-        if group_key not in grouped_findings:
-            grouped_findings[group_key] = []
-        grouped_findings[group_key].append(finding)
+        if debug_enabled:
+            group_sizes[group_key] += 1
+        rank = _finding_rank(finding)
+        incumbent = get_best(group_key)
+        if incumbent is None or rank > incumbent[0]:
+            best[group_key] = (rank, finding)
     
-    # For each group, keep only the highest-precedence finding
-    deduplicated = []
+    deduplicated = [finding for _, finding in best.values()]
     
-    for group_key, group_findings in grouped_findings.items():
-        if len(group_findings) == 1:
-            # No duplicates in this group
-            deduplicated.append(group_findings[0])
-        else:
-            # Multiple findings for same location - apply precedence rules
-            best_finding = _select_best_finding(group_findings)
-            deduplicated.append(best_finding)
-            
-            # Log deduplication for debugging
-            if len(group_findings) > 1:
+    # Log deduplication for debugging
+    if debug_enabled:
+        for group_key, (rank, best_finding) in best.items():
+            if group_sizes[group_key] > 1:
                 logger.debug(
-                    f"Deduplicated {len(group_findings)} findings for {group_key[0]}:{group_key[1]} "
-                    f"-> keeping {best_finding.rule_id} (precedence: {_get_rule_precedence(best_finding)})"
+                    f"Deduplicated {group_sizes[group_key]} findings for {group_key[0]}:{group_key[1]} "
+                    f"-> keeping {best_finding.rule_id} (precedence: {rank[0]})"
                 )
     
     logger.info(f"Deduplication reduced {len(findings)} findings to {len(deduplicated)} unique findings")
@@ -422,69 +420,141 @@ def _select_best_finding(findings: List[Finding]) -> Finding:
     if len(findings) == 1:
         return findings[0]
     
-    # Sort by precedence, then confidence, then rule_id for deterministic selection
-    sorted_findings = sorted(
-        findings,
-        key=lambda f: (
-            _get_rule_precedence(f),  # Higher precedence first
-            f.confidence or 0.0,      # Higher confidence first  
-            f.rule_id                 # Alphabetical for tie-breaking
-        ),
-        reverse=True
-    )
-    
-    return sorted_findings[0]
+    # Highest precedence, then confidence, then rule_id for deterministic
+    # selection; max() keeps the first of equally ranked findings
+    return max(findings, key=_finding_rank)
 
 
-def run_rules(files: List[pathlib.Path]) -> List[Finding]:
+def _scan_file(file_path: pathlib.Path, rules: List[Rule]) -> List[Finding]:
     """
-    Main function to run all loaded rules against a list of files.
+    Apply all rules to a single file, logging and skipping failures.
     """
-    # Initialize rule loader with rules directory
-    rules_dir = pathlib.Path(__file__).parent.parent / "rules"
-    loader = RuleLoader(rules_dir)
+    if not file_path.exists():
+        logger.warning(f"File does not exist: {file_path}")
+        return []
 
-    # Load all available rules
-    rules = loader.load_rules()
+    file_findings: List[Finding] = []
 
-    if not rules:
-        raise RuntimeError("No rules were successfully loaded")
+    try:
+        # Read file content
+        content = file_path.read_text(encoding='utf-8', errors='ignore')
+
+        # Apply all rules to this file
+        for rule in rules:
+            try:
+                findings = rule.apply(file_path, content)
+                if findings:
+                    file_findings.extend(findings)
+                    logger.debug(f"Rule {rule.id} found {len(findings)} issues in {file_path}")
+            except Exception as e:
+                logger.error(f"Rule {rule.id} failed on file {file_path}: {e}")
+                continue
+
+    except (IOError, UnicodeDecodeError, PermissionError) as e:
+        logger.warning(f"Could not read file {file_path}: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error processing file {file_path}: {e}")
 
-    logger.info(f"Loaded {len(rules)} rules for scanning")
+    return file_findings
 
-    # Process files and collect findings
-    all_findings: List[Finding] = []
 
+def _init_worker(rules_dir: pathlib.Path, log_level: int) -> None:
+    """
+    Load rules once in a worker process so their patterns compile once per worker.
+
+    Workers started with the spawn method (macOS, Windows) do not inherit the
+    parent's logging setup, so it is configured here to keep read and rule
+    failures from _scan_file visible.
+    """
+    global _worker_rules
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=log_level)
+    _worker_rules = RuleLoader(rules_dir).load_rules()
+    if not _worker_rules:
+        raise RuntimeError("No rules were successfully loaded")
+
+
+def _scan_files_in_worker(files: List[pathlib.Path]) -> List[Finding]:
+    """
+    Scan a batch of files in a worker process using the worker's rules.
+    """
+    findings: List[Finding] = []
     for file_path in files:
-        if not file_path.exists():
-            logger.warning(f"File does not exist: {file_path}")
-            continue
+        findings.extend(_scan_file(file_path, _worker_rules))
+    return findings
+
+
+def _run_rules_parallel(
+    files: List[pathlib.Path], rules_dir: pathlib.Path, max_workers: int
+) -> List[Finding]:
+    """
+    Scan files across worker processes in fixed-size batches, preserving file order.
+    """
+    batches = [
+        files[i:i + PARALLEL_CHUNK_SIZE] for i in range(0, len(files), PARALLEL_CHUNK_SIZE)
+    ]
+    findings: List[Finding] = []
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(batches)),
+        initializer=_init_worker,
+        initargs=(rules_dir, logging.getLogger().getEffectiveLevel()),
+    ) as executor:
+        for batch_findings in executor.map(_scan_files_in_worker, batches):
+            findings.extend(batch_findings)
+    return findings
+
+
+def run_rules(
+    files: List[pathlib.Path],
+    max_workers: int = 1,
+    rules: Optional[List[Rule]] = None,
+) -> List[Finding]:
+    """
+    Main function to run all loaded rules against a list of files.
 
+    Files are scanned in-process by default. With ``max_workers`` above 1,
+    large file sets are scanned in a process pool (one rule set per worker),
+    falling back to the in-process scan if the pool fails for any reason.
+
+    Args:
+        files: Files to scan
+        max_workers: Worker processes for large scans (1 disables the pool)
+        rules: Rules to apply instead of those discovered in the rules
+            directory; these are always applied in-process
+
+    Returns:
+        Deduplicated findings across all files
+    """
+    rules_dir = pathlib.Path(__file__).parent.parent / "rules"
+    all_findings: Optional[List[Finding]] = None
+
+    # Workers load their own rule set from the rules directory, so only
+    # discovered rules can be scanned in parallel
+    if rules is None and max_workers > 1 and len(files) >= PARALLEL_MIN_FILES:
         try:
-            # Read file content
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-
-            # Apply all rules to this file
-            for rule in rules:
-                try:
-                    findings = rule.apply(file_path, content)
-                    if findings:
-                        all_findings.extend(findings)
-                        logger.debug(f"Rule {rule.id} found {len(findings)} issues in {file_path}")
-                except Exception as e:
-                    logger.error(f"Rule {rule.id} failed on file {file_path}: {e}")
-                    continue
-
-        except (IOError, UnicodeDecodeError, PermissionError) as e:
-            logger.warning(f"Could not read file {file_path}: {e}")
-            continue
+            all_findings = _run_rules_parallel(files, rules_dir, max_workers)
         except Exception as e:
-            logger.error(f"Unexpected error processing file {file_path}: {e}")
-            continue
+            logger.warning(f"Parallel scan failed, falling back to sequential scan: {e}")
+
+    if all_findings is None:
+        if rules is None:
+            # Initialize rule loader with rules directory and load all available rules
+            loader = RuleLoader(rules_dir)
+            rules = loader.load_rules()
+
+        if not rules:
+            raise RuntimeError("No rules were successfully loaded")
+
+        logger.info(f"Loaded {len(rules)} rules for scanning")
+
+        # Process files and collect findings
+        all_findings = []
+        for file_path in files:
+            all_findings.extend(_scan_file(file_path, rules))
 
     # Apply deduplication to remove duplicate findings for the same token
     deduplicated_findings = _deduplicate_findings(all_findings)
     
     logger.info(f"Scan complete: {len(deduplicated_findings)} unique findings across {len(files)} files "
                 f"(reduced from {len(all_findings)} total findings)")
-    return deduplicated_findings
+    return deduplicated_findings
\ No newline at end of file
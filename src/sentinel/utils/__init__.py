@@ -16,6 +16,7 @@ SPDX-License-Identifier: MIT
 from sentinel.utils.entropy import shannon_entropy, is_high_entropy
 from sentinel.utils.patterns import (
     compile_patterns,
+    compile_alternation,
     match_patterns,
     validate_pattern,
     create_secret_patterns,
@@ -26,6 +27,7 @@ __all__ = [
     "shannon_entropy",
     "is_high_entropy",
     "compile_patterns",
+    "compile_alternation",
     "match_patterns",
     "validate_pattern",
     "create_secret_patterns",
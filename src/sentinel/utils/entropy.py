@@ -10,7 +10,23 @@ SPDX-License-Identifier: MIT
 
 import math
 import re
-from typing import Dict, Set
+import string
+from collections import Counter
+from functools import lru_cache
+
+
+_ASCII_LOWERCASE = string.ascii_lowercase
+
+# Words marking test/example values rather than real secrets
+_COMMON_WORDS = (
+    'test', 'example', 'demo', 'sample', 'placeholder',
+    'changeme', 'password', 'secret', 'key', 'token',
+)
+
+# UUID pattern (version 1-5), compiled once at import time
+_UUID_PATTERN = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$', re.IGNORECASE
+)
 
 
 def shannon_entropy(data: str) -> float:
@@ -36,14 +52,22 @@ def shannon_entropy(data: str) -> float:
     if not data:
         return 0.0
 
-    # Count frequency of each character
-    frequency: Dict[str, int] = {}
-    for char in data:
-        frequency[char] = frequency.get(char, 0) + 1
+    # Count frequency of each character; Counter tallies in C
+    return _entropy_from_frequency(Counter(data), len(data))
+
 
-    # Calculate entropy
+def _entropy_from_frequency(frequency: Counter, data_len: int) -> float:
+    """
+    Calculate Shannon entropy from precomputed character counts.
+
+    Args:
+        frequency: Character counts of the string
+        data_len: Length of the string
+
+    Returns:
+        Entropy value of the counted string
+    """
     entropy = 0.0
-    data_len = len(data)
 
     for count in frequency.values():
         probability = count / data_len
@@ -99,6 +123,25 @@ def is_likely_secret(data: str, min_length: int = 20, threshold: float = 4.0) ->
     if len(data) < min_length:
         return False
 
+    # Only candidates long enough to be scored reach the cache, so short
+    # strings never take up an entry
+    return _is_likely_secret_candidate(data, threshold)
+
+
+@lru_cache(maxsize=2048)
+def _is_likely_secret_candidate(data: str, threshold: float) -> bool:
+    """
+    Apply the pattern, diversity and entropy checks to a length-qualified string.
+
+    Memoized because copy-pasted tokens recur across files in a scan.
+
+    Args:
+        data: String that already meets the minimum length
+        threshold: Entropy threshold
+
+    Returns:
+        True if string is likely to be a secret, False otherwise
+    """
     # Skip obvious non-secrets
     if _is_common_pattern(data):
         return False
@@ -125,8 +168,7 @@ def _is_common_pattern(data: str) -> bool:
         True if string matches common non-secret pattern, False otherwise
     """
     # UUID pattern (version 1-5)
-    uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$'
-    if re.match(uuid_pattern, data, re.IGNORECASE):
+    if _UUID_PATTERN.match(data):
         return True
 
     # Common base64 padding patterns (often appear in encoded data)
@@ -143,12 +185,8 @@ def _is_common_pattern(data: str) -> bool:
         return True
 
     # Common test/example patterns
-    test_patterns = {
-        'test', 'example', 'demo', 'sample', 'placeholder',
-        'changeme', 'password', 'secret', 'key', 'token'
-    }
     data_lower = data.lower()
-    if any(pattern in data_lower for pattern in test_patterns):
+    if any(pattern in data_lower for pattern in _COMMON_WORDS):
         return True
 
     # Sequential patterns (123456, abcdef, etc.)
@@ -190,21 +228,33 @@ def _is_sequential_pattern(data: str) -> bool:
     """
     # Check for numeric sequences
     if data.isdigit():
-        # Simple numeric sequence check
-        for i in range(len(data) - 1):
-            if abs(int(data[i]) - int(data[i + 1])) != 1:
-                break
+        if data.isascii():
+            # ASCII digit codes differ exactly as the digit values do, so the
+            # adjacent pairs can be compared on the encoded bytes
+            codes = data.encode("ascii")
+            if all(abs(a - b) == 1 for a, b in zip(codes, codes[1:])):
+                return True  # All consecutive numbers
         else:
-            return True  # All consecutive numbers
+            # Simple numeric sequence check
+            for i in range(len(data) - 1):
+                if abs(int(data[i]) - int(data[i + 1])) != 1:
+                    break
+            else:
+                return True  # All consecutive numbers
 
     # Check for alphabetical sequences (basic)
     if data.isalpha():
         data_lower = data.lower()
-        for i in range(len(data_lower) - 1):
-            if ord(data_lower[i + 1]) - ord(data_lower[i]) != 1:
-                break
+        if data.isascii():
+            # An ascending run of ASCII letters is a slice of the alphabet
+            if data_lower in _ASCII_LOWERCASE:
+                return True  # All consecutive letters
         else:
-            return True  # All consecutive letters
+            for i in range(len(data_lower) - 1):
+                if ord(data_lower[i + 1]) - ord(data_lower[i]) != 1:
+                    break
+            else:
+                return True  # All consecutive letters
 
     return False
 
@@ -225,10 +275,13 @@ def calculate_entropy_score(data: str) -> float:
     if not data or len(data) < 10:
         return 0.0
 
-    base_entropy = shannon_entropy(data)
+    # Count characters once and derive both the entropy and the character set
+    # size from the same tally
+    frequency = Counter(data)
+    base_entropy = _entropy_from_frequency(frequency, len(data))
     
     # Normalize by maximum possible entropy (log2 of character set size)
-    char_set_size = len(set(data))
+    char_set_size = len(frequency)
     max_possible_entropy = math.log2(char_set_size) if char_set_size > 0 else 0
     
     if max_possible_entropy == 0:
@@ -9,9 +9,102 @@ SPDX-License-Identifier: MIT
 """
 
 import pathlib
+from functools import lru_cache
 from typing import Optional
 
 
+# Mapping of common file extensions to language identifiers, built once at
+# import time so each lookup is a single dict probe
+_EXTENSION_MAP = {
+    # Python files
+    '.py': 'python',
+    
+    # JavaScript/TypeScript files
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+    
+    # Configuration files
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.json': 'json',
+    '.toml': 'toml',
+    '.ini': 'ini',
+    '.cfg': 'ini',
+    '.conf': 'ini',
+    
+    # Environment files
+    '.env': 'env',
+    
+    # Shell scripts
+    '.sh': 'shell',
+    '.bash': 'shell',
+    '.zsh': 'shell',
+    
+    # HTML/CSS
+    '.html': 'html',
+    '.htm': 'html',
+    '.css': 'css',
+    
+    # Markdown
+    '.md': 'markdown',
+    '.markdown': 'markdown',
+    
+    # XML
+    '.xml': 'xml',
+    
+    # SQL
+    '.sql': 'sql',
+    
+    # Docker
+    '.dockerfile': 'dockerfile',
+    'Dockerfile': 'dockerfile',
+    
+    # Makefile
+    'Makefile': 'makefile',
+    
+    # Text files
+    '.txt': 'text',
+    '.log': 'text',
+    
+    # C/C++
+    '.c': 'c',
+    '.h': 'c',
+    '.cpp': 'cpp',
+    '.hpp': 'cpp',
+    '.cc': 'cpp',
+    
+    # Java
+    '.java': 'java',
+    
+    # Go
+    '.go': 'go',
+    
+    # Rust
+    '.rs': 'rust',
+    
+    # PHP
+    '.php': 'php',
+    
+    # Ruby
+    '.rb': 'ruby',
+    
+    # C#
+    '.cs': 'csharp',
+    
+    # Swift
+    '.swift': 'swift',
+    
+    # Kotlin
+    '.kt': 'kotlin',
+    '.kts': 'kotlin',
+    
+    # Scala
+    '.scala': 'scala',
+}
+
+
 def detect_language(path: pathlib.Path) -> Optional[str]:
     """
     Return a language identifier based on file extension.
@@ -31,108 +124,35 @@ def detect_language(path: pathlib.Path) -> Optional[str]:
         >>> detect_language(pathlib.Path('unknown.xyz'))
         None
     """
-    # Mapping of common file extensions to language identifiers
-    extension_map = {
-        # Python files
-        '.py': 'python',
-        
-        # JavaScript/TypeScript files
-        '.js': 'javascript',
-        '.jsx': 'javascript',
-        '.ts': 'typescript',
-        '.tsx': 'typescript',
-        
-        # Configuration files
-        '.yaml': 'yaml',
-        '.yml': 'yaml',
-        '.json': 'json',
-        '.toml': 'toml',
-        '.ini': 'ini',
-        '.cfg': 'ini',
-        '.conf': 'ini',
-        
-        # Environment files
-        '.env': 'env',
-        
-        # Shell scripts
-        '.sh': 'shell',
-        '.bash': 'shell',
-        '.zsh': 'shell',
-        
-        # HTML/CSS
-        '.html': 'html',
-        '.htm': 'html',
-        '.css': 'css',
-        
-        # Markdown
-        '.md': 'markdown',
-        '.markdown': 'markdown',
-        
-        # XML
-        '.xml': 'xml',
-        
-        # SQL
-        '.sql': 'sql',
-        
-        # Docker
-        '.dockerfile': 'dockerfile',
-        'Dockerfile': 'dockerfile',
-        
-        # Makefile
-        'Makefile': 'makefile',
-        
-        # Text files
-        '.txt': 'text',
-        '.log': 'text',
-        
-        # C/C++
-        '.c': 'c',
-        '.h': 'c',
-        '.cpp': 'cpp',
-        '.hpp': 'cpp',
-        '.cc': 'cpp',
-        
-        # Java
-        '.java': 'java',
-        
-        # Go
-        '.go': 'go',
-        
-        # Rust
-        '.rs': 'rust',
-        
-        # PHP
-        '.php': 'php',
-        
-        # Ruby
-        '.rb': 'ruby',
-        
-        # C#
-        '.cs': 'csharp',
-        
-        # Swift
-        '.swift': 'swift',
-        
-        # Kotlin
-        '.kt': 'kotlin',
-        '.kts': 'kotlin',
-        
-        # Scala
-        '.scala': 'scala',
-    }
-    
-    # Handle case where the file name itself is the identifier (e.g., Dockerfile, Makefile)
-    file_name = path.name
-    
+    return _detect_language_by_name(path.name)
+
+
+@lru_cache(maxsize=8192)
+def _detect_language_by_name(file_name: str) -> Optional[str]:
+    """
+    Resolve a language identifier from a bare file name.
+
+    Keyed on the name string so repeated names across a scan are a cache hit.
+
+    Args:
+        file_name: Final path component of the file
+
+    Returns:
+        Language identifier, or None if unknown
+    """
     # Handle environment files with additional extensions (e.g., .env.local, .env.production)
     if file_name.startswith('.env'):
         return 'env'
     
-    if file_name in extension_map:
-        return extension_map[file_name]
+    # Handle case where the file name itself is the identifier (e.g., Dockerfile, Makefile)
+    if file_name in _EXTENSION_MAP:
+        return _EXTENSION_MAP[file_name]
     
-    # Get file extension and normalize to lowercase
-    extension = path.suffix.lower()
+    # Get file extension (same rules as pathlib's suffix) and normalize to lowercase
+    dot = file_name.rfind('.')
+    if not 0 < dot < len(file_name) - 1:
+        return None
+    extension = file_name[dot:].lower()
     
     # Return the language identifier if extension is in the map
-    return extension_map.get(extension, None)
\ No newline at end of file
+    return _EXTENSION_MAP.get(extension, None)
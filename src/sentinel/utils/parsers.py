@@ -1,10 +1,14 @@
 import json
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 import yaml
 
 
+_DOCKERFILE_INSTRUCTION_PATTERN = re.compile(r"^([A-Z]+)\s+(.*)$", re.IGNORECASE)
+
+
 def parse_json(content: str) -> Optional[Dict[str, Any]]:
     """Safely parse JSON content and return the parsed object."""
     try:
@@ -27,11 +31,22 @@ def load_yaml_document(content: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+@lru_cache(maxsize=64)
+def _yaml_key_pattern(key_name: str) -> Pattern[str]:
+    """
+    Compile the line pattern for a YAML key.
+
+    Rules look up the same few keys for every workflow file, so each pattern
+    is compiled once and reused.
+    """
+    return re.compile(rf"^(\s*){re.escape(key_name)}\s*:", re.IGNORECASE)
+
+
 def _find_yaml_key_line(content: str, key_name: str) -> int:
     """
     Find the first line number where the top-level key appears.
     """
-    pattern = re.compile(rf"^(\s*){re.escape(key_name)}\s*:", re.IGNORECASE)
+    pattern = _yaml_key_pattern(key_name)
     for i, line in enumerate(content.splitlines()):
         if pattern.match(line):
             return i + 1
@@ -65,24 +80,23 @@ def parse_dockerfile(content: str) -> List[Tuple[str, str, int]]:
     pending = ""
     pending_line = 0
 
-    for i, raw_line in enumerate(content.splitlines()):
-        line_num = i + 1
-        line = raw_line.rstrip()
+    for line_num, raw_line in enumerate(content.splitlines(), 1):
+        line = raw_line.strip()
 
-        if not line.strip() or line.lstrip().startswith("#"):
+        if not line or line[0] == "#":
             continue
 
         if pending:
-            pending += " " + line.strip()
+            pending += " " + line
         else:
-            pending = line.strip()
+            pending = line
             pending_line = line_num
 
-        if pending.endswith("\\"):
+        if pending[-1] == "\\":
             pending = pending[:-1].strip()
             continue
 
-        match = re.match(r"^([A-Z]+)\s+(.*)$", pending, re.IGNORECASE)
+        match = _DOCKERFILE_INSTRUCTION_PATTERN.match(pending)
         if match:
             instruction = match.group(1).upper()
             arguments = match.group(2).strip()
@@ -93,6 +107,22 @@ def parse_dockerfile(content: str) -> List[Tuple[str, str, int]]:
     return instructions
 
 
+@lru_cache(maxsize=64)
+def _hcl_header_pattern(block_type: str, block_name: Optional[str]) -> Pattern[str]:
+    """
+    Compile the header pattern for an HCL block type and optional name.
+
+    Rules look up the same few block types for every Terraform file, so each
+    pattern is compiled once and reused.
+    """
+    header_pattern = (
+        rf'^\s*{re.escape(block_type)}\s+"{re.escape(block_name)}"\s+"[^"]*"\s*\{{'
+        if block_name
+        else rf'^\s*{re.escape(block_type)}\s+"[^"]*"\s*(?:"[^"]*")?\s*\{{'
+    )
+    return re.compile(header_pattern, re.IGNORECASE)
+
+
 def find_hcl_blocks(
     content: str, block_type: str, block_name: Optional[str] = None
 ) -> List[Tuple[str, int]]:
@@ -101,11 +131,7 @@ def find_hcl_blocks(
     block_name using a simple brace counting approach.
     """
     blocks: List[Tuple[str, int]] = []
-    header_pattern = (
-        rf'^\s*{re.escape(block_type)}\s+"{re.escape(block_name)}"\s+"[^"]*"\s*\{{'
-        if block_name
-        else rf'^\s*{re.escape(block_type)}\s+"[^"]*"\s*(?:"[^"]*")?\s*\{{'
-    )
+    header_pattern = _hcl_header_pattern(block_type, block_name)
     lines = content.splitlines()
     collecting = False
     brace_depth = 0
@@ -114,7 +140,7 @@ def find_hcl_blocks(
 
     for i, line in enumerate(lines):
         if not collecting:
-            if re.match(header_pattern, line, re.IGNORECASE):
+            if header_pattern.match(line):
                 collecting = True
                 brace_depth = line.count("{") - line.count("}")
                 block_lines = [line]
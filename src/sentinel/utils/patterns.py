@@ -9,6 +9,7 @@ SPDX-License-Identifier: MIT
 
 import re
 import logging
+from bisect import bisect_left
 from typing import Dict, List, Tuple, Optional, Pattern
 from dataclasses import dataclass
 
@@ -47,6 +48,65 @@ def compile_patterns(pattern_definitions: Dict[str, str]) -> Dict[str, Pattern]:
     return compiled_patterns
 
 
+def compile_alternation(pattern_definitions: Dict[str, str]) -> Pattern:
+    """
+    Compile regex patterns into a single alternation with one named group per pattern.
+
+    The combined pattern scans content once instead of once per pattern; the
+    ``lastgroup`` of a match identifies which pattern matched.
+
+    Args:
+        pattern_definitions: Dictionary mapping pattern IDs to regex strings
+
+    Returns:
+        Compiled regex pattern combining all definitions
+    """
+    return re.compile(
+        "|".join(f"(?P<{pattern_id}>{regex})" for pattern_id, regex in pattern_definitions.items()),
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+
+def contains_any(content: str, needles: Tuple[str, ...]) -> bool:
+    """
+    Check whether content contains any of the given lowercase substrings.
+
+    Used as a cheap pre-filter before running case-insensitive regex patterns:
+    plain substring search is far faster than a regex scan, so content that
+    contains none of a rule's required substrings can be skipped outright.
+
+    Args:
+        content: Text content to check
+        needles: Lowercase substrings to look for
+
+    Returns:
+        True if any needle occurs in the case-folded content
+    """
+    folded = content.casefold()
+    return any(needle in folded for needle in needles)
+
+
+def _newline_offsets(content: str) -> List[int]:
+    """
+    Return the sorted offsets of every newline in content.
+
+    Built once per content so that mapping a match offset to its line number
+    is a binary search instead of re-counting newlines in a prefix slice.
+
+    Args:
+        content: Text content to index
+
+    Returns:
+        List of newline character positions in ascending order
+    """
+    offsets = []
+    position = content.find('\n')
+    while position != -1:
+        offsets.append(position)
+        position = content.find('\n', position + 1)
+    return offsets
+
+
 def match_patterns(
     content: str,
     compiled_patterns: Dict[str, Pattern],
@@ -64,12 +124,13 @@ def match_patterns(
         List of PatternMatch objects for all matches found
     """
     matches = []
+    newline_offsets = _newline_offsets(content)
 
     for pattern_id, pattern in compiled_patterns.items():
         pattern_matches = pattern.finditer(content)
         for match in pattern_matches:
-            # Calculate line number
-            line_number = content[:match.start()].count('\n') + 1
+            # Calculate line number from the newlines preceding the match
+            line_number = bisect_left(newline_offsets, match.start()) + 1
 
             # Extract context around the match
             start_pos = max(0, match.start() - 100)  # 100 chars before
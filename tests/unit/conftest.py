@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the unit test suite.
+
+Copyright (c) 2025 Andrei Antonescu
+SPDX-License-Identifier: MIT
+"""
+
+import json
+
+import pytest
+
+
+BIG_FINDINGS_COUNT = 5000
+
+
+@pytest.fixture(scope="session")
+def big_findings_json():
+    """A large scan report serialized once per test session."""
+    return json.dumps({
+        "scan_summary": {"total_findings": BIG_FINDINGS_COUNT},
+        "findings": [
+            {"rule_id": f"rule_{i % 25}", "file": f"src/module_{i}.py", "line": i}
+            for i in range(BIG_FINDINGS_COUNT)
+        ],
+    })
@@ -169,6 +169,16 @@ class TestExplanationBatching:
             # Should include rule_id context in the explanation
             assert rule_id in explanation["explanation"]
     
+    def test_explain_batch_concurrent_matches_serial(self):
+        """Test that concurrent batch explanation matches serial execution."""
+        serial_explainer = ExplanationEngine(max_workers=1)
+        
+        concurrent_result = self.explainer.explain_batch(self.findings, self.provider)
+        serial_result = serial_explainer.explain_batch(self.findings, self.provider)
+        
+        assert list(concurrent_result.keys()) == list(serial_result.keys())
+        assert concurrent_result == serial_result
+    
     def test_explain_batch_performance_with_large_batch(self):
         """Test explain_batch performance with a large number of findings."""
         # Create many findings with few unique rule_ids
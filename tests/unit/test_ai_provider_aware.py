@@ -10,6 +10,7 @@ SPDX-License-Identifier: MIT
 
 import pytest
 import pathlib
+import re
 from unittest.mock import Mock, patch
 from typing import List, Dict, Any, Optional
 
@@ -24,19 +25,27 @@ from sentinel.rules.token_types import TokenType, classify_token
 from sentinel.llm.provider import LLMProvider
 
 
+# Prompt markers scanned in a single pass; case-insensitive except for AWS
+_PROMPT_MARKERS = re.compile(r"(?P<aws>AWS|aws)|(?i:(?P<test>test)|(?P<production>production))")
+
+# Canned responses in precedence order (first marker present wins)
+_MARKER_RESPONSES = {
+    "aws": "This is an AWS-related security risk with critical impact on cloud infrastructure.",
+    "test": "This is a test key with reduced risk in non-production environments.",
+    "production": "This is a production key with elevated risk requiring immediate attention.",
+}
+
+
 class MockProvider(LLMProvider):
     """Mock LLM provider for testing provider-aware explanations."""
     
     def generate(self, prompt: str) -> str:
         # Simulate provider-aware responses based on prompt content
-        if "AWS" in prompt or "aws" in prompt:
-            return "This is an AWS-related security risk with critical impact on cloud infrastructure."
-        elif "test" in prompt.lower():
-            return "This is a test key with reduced risk in non-production environments."
-        elif "production" in prompt.lower():
-            return "This is a production key with elevated risk requiring immediate attention."
-        else:
-            return "Generic security explanation for the detected finding."
+        found = {match.lastgroup for match in _PROMPT_MARKERS.finditer(prompt)}
+        for marker, response in _MARKER_RESPONSES.items():
+            if marker in found:
+                return response
+        return "Generic security explanation for the detected finding."
 
 
 class TestProviderAwareRiskScoring:
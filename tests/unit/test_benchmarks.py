@@ -0,0 +1,104 @@
+"""
+Performance benchmarks for the scan engine and dogfooding runner hot paths.
+
+Skipped unless pytest-benchmark is installed. Record a baseline with
+``pytest tests/unit/test_benchmarks.py --benchmark-autosave`` and compare
+later runs with ``--benchmark-compare --benchmark-compare-fail=mean:10%``.
+"""
+
+import pathlib
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from sentinel.rules.base import Finding
+from sentinel.scanner.engine import run_rules
+
+# Add the project root to the Python path to import tools
+project_root = pathlib.Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.dogfood_runner import DogfoodRunner, extract_json_from_output
+
+
+pytestmark = pytest.mark.slow
+
+BENCHMARK_FILE_COUNT = 200
+BENCHMARK_ROUNDS = 20
+
+
+class BenchmarkMarkerRule:
+    """Rule reporting every line that contains SECRET_MARKER."""
+
+    id = "BENCHMARK_MARKER_RULE"
+    description = "Reports lines containing the benchmark marker"
+    severity = "medium"
+
+    def apply(self, path, text):
+        return [
+            Finding(
+                rule_id=self.id,
+                file_path=path,
+                line=line_num,
+                severity=self.severity,
+                excerpt=line.strip(),
+                confidence=0.8,
+            )
+            for line_num, line in enumerate(text.splitlines(), 1)
+            if "SECRET_MARKER" in line
+        ]
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Dogfood runner shared by the benchmarks."""
+    return DogfoodRunner(target_path="./sample-project", output_dir="./test-output")
+
+
+@pytest.fixture(scope="module")
+def scan_files(tmp_path_factory):
+    """Files with a handful of marker lines each, written once per module."""
+    root = tmp_path_factory.mktemp("benchmark_files")
+    files = []
+    for i in range(BENCHMARK_FILE_COUNT):
+        file_path = root / f"module_{i}.py"
+        file_path.write_text(
+            "\n".join(
+                f"value_{j} = 'SECRET_MARKER_{j}'" if j % 10 == 0 else f"value_{j} = {j}"
+                for j in range(100)
+            )
+        )
+        files.append(file_path)
+    return files
+
+
+def test_count_findings_from_json_benchmark(benchmark, runner, big_findings_json):
+    """Benchmark counting findings in a large JSON report."""
+    # Clear the extraction cache each round so the parse is measured, not a hit
+    count = benchmark.pedantic(
+        runner._count_findings_from_json,
+        args=(big_findings_json,),
+        setup=extract_json_from_output.cache_clear,
+        rounds=BENCHMARK_ROUNDS,
+    )
+    assert count == 5000
+
+
+def test_count_findings_from_noisy_output_benchmark(benchmark, runner, big_findings_json):
+    """Benchmark counting findings when log lines surround the JSON report."""
+    output = "Scanning 5000 files...\n" + big_findings_json + "\nScan complete\n"
+    count = benchmark.pedantic(
+        runner._count_findings_from_json,
+        args=(output,),
+        setup=extract_json_from_output.cache_clear,
+        rounds=BENCHMARK_ROUNDS,
+    )
+    assert count == 5000
+
+
+def test_run_rules_benchmark(benchmark, scan_files):
+    """Benchmark a sequential scan and deduplication over many files."""
+    findings = benchmark(run_rules, scan_files, max_workers=1, rules=[BenchmarkMarkerRule()])
+    assert len(findings) == BENCHMARK_FILE_COUNT * 10
@@ -1,7 +1,10 @@
+import os
+import stat
 import unittest
 import pathlib
 import json
 import shutil
+import tempfile
 from typing import Dict, Any
 from unittest.mock import patch, MagicMock
 import logging
@@ -13,20 +16,14 @@ from sentinel.api.models import SharedConfig, ScanConfig, ScanOptions, UserPrefe
 
 class TestConfigManager(unittest.TestCase):
     def setUp(self):
-        # Create a temporary directory structure for testing config persistence
-        self.temp_dir = pathlib.Path("./temp_config_test")
+        # Create a fresh temporary directory for testing config persistence
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="codesentinel-config-"))
         self.config_path = self.temp_dir / "codesentinel" / "config.json"
-        
-        # Ensure directory is clean before starting
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-            
         self.config_manager = ConfigManager(config_path=self.config_path)
 
     def tearDown(self):
         # Clean up the temporary directory
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     @patch('pathlib.Path.home', return_value=pathlib.Path('/mock/home'))
     def test_get_default_config_path(self, mock_home):
@@ -47,6 +44,26 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(loaded_config.scan_defaults.enable_debug, False)
         self.assertEqual(loaded_config.scan_defaults.scan_options.enable_profiling, False)
 
+    def test_save_config_replaces_file_without_leaving_temp_file(self):
+        # Saves go through a temp file that is renamed over the config
+        self.assertTrue(self.config_manager.save_config(SharedConfig()))
+        self.assertTrue(self.config_manager.save_config(SharedConfig()))
+
+        self.assertEqual(
+            sorted(p.name for p in self.config_path.parent.iterdir()),
+            ["config.json"],
+        )
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_save_config_preserves_file_mode(self):
+        # The config can hold API keys, so a restricted mode must survive saves
+        self.assertTrue(self.config_manager.save_config(SharedConfig()))
+        self.config_path.chmod(0o600)
+
+        self.assertTrue(self.config_manager.save_config(SharedConfig()))
+
+        self.assertEqual(stat.S_IMODE(self.config_path.stat().st_mode), 0o600)
+
     def test_save_and_load_with_custom_values(self):
         # Test saving and loading custom values, including boolean flags
         custom_config = SharedConfig(
@@ -116,4 +133,21 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(loaded_config.scan_defaults.scan_options.enable_profiling, original_config.scan_defaults.scan_options.enable_profiling)
         self.assertEqual(loaded_config.user_preferences.language, original_config.user_preferences.language)
         self.assertIn("deepseek", loaded_config.ai_providers)
-        self.assertEqual(loaded_config.ai_providers["deepseek"].api_key, "secret")
\ No newline at end of file
+        self.assertEqual(loaded_config.ai_providers["deepseek"].api_key, "secret")
+
+    def test_load_config_reuses_cached_config_until_file_changes(self):
+        # Repeat loads of an unchanged file return the memoized config
+        self.config_manager.save_config(SharedConfig())
+
+        first = self.config_manager.load_config()
+        second = self.config_manager.load_config()
+        self.assertIs(first, second)
+
+        # An external edit to the file invalidates the cache
+        data = json.loads(self.config_path.read_text())
+        data["scan_defaults"]["enable_debug"] = True
+        self.config_path.write_text(json.dumps(data))
+
+        reloaded = self.config_manager.load_config()
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded.scan_defaults.enable_debug, True)
@@ -14,7 +14,6 @@ import pytest
 from sentinel.rules.base import Finding
 from sentinel.scanner.engine import (
     _get_rule_precedence, 
-    _extract_token_from_excerpt,
     _get_finding_group_key,
     _deduplicate_findings,
     _select_best_finding
@@ -97,51 +96,6 @@ class TestDeduplicationPrecedence:
         assert _get_rule_precedence(finding) == 50
 
 
-class TestTokenExtraction:
-    """Test cases for token extraction from excerpts."""
-    
-    def test_extract_quoted_string(self):
-        """Test extracting token from quoted string."""
-        excerpt = 'api_key = "sk_test_abcdefghijklmnopqrstuvwx"'
-        token = _extract_token_from_excerpt(excerpt)
-        assert token == "sk_test_abcdefghijklmnopqrstuvwx"
-    
-    def test_extract_single_quoted_string(self):
-        """Test extracting token from single quoted string."""
-        excerpt = "password = 'MySecretPassword123'"
-        token = _extract_token_from_excerpt(excerpt)
-        assert token == "MySecretPassword123"
-    
-    def test_extract_unquoted_assignment(self):
-        """Test extracting token from unquoted assignment."""
-        excerpt = "token = abcdefghijklmnopqrstuvwxyz123456"
-        token = _extract_token_from_excerpt(excerpt)
-        assert token == "abcdefghijklmnopqrstuvwxyz123456"
-    
-    def test_extract_yaml_style(self):
-        """Test extracting token from YAML-style assignment."""
-        excerpt = 'secret_key: "AKIA1234567890123456"'
-        token = _extract_token_from_excerpt(excerpt)
-        assert token == "AKIA1234567890123456"
-    
-    def test_extract_fallback_long_string(self):
-        """Test fallback extraction of long alphanumeric strings."""
-        excerpt = "This contains a long string ABCDEFGHIJKLMNOPQRSTUVWXYZ123456"
-        token = _extract_token_from_excerpt(excerpt)
-        assert token == "ABCDEFGHIJKLMNOPQRSTUVWXYZ123456"
-    
-    def test_no_token_found(self):
-        """Test when no token can be extracted."""
-        excerpt = "This is a normal line without any tokens"
-        token = _extract_token_from_excerpt(excerpt)
-        assert token is None
-    
-    def test_empty_excerpt(self):
-        """Test extraction from empty excerpt."""
-        token = _extract_token_from_excerpt("")
-        assert token is None
-
-
 class TestFindingGrouping:
     """Test cases for finding grouping logic."""
     
@@ -8,12 +8,15 @@ Copyright (c) 2025 Andrei Antonescu
 SPDX-License-Identifier: MIT
 """
 
+import copy
 import json
 import pathlib
+import subprocess
 import tempfile
-import unittest
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 # Import the dogfood runner module
 import sys
 import os
@@ -22,25 +25,94 @@ import os
 project_root = pathlib.Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from tools.dogfood_runner import DogfoodRunner, DogfoodScenario, ScenarioResult
+from tools.dogfood_runner import (
+    DogfoodRunner,
+    DogfoodScenario,
+    ScenarioResult,
+    extract_json_from_output,
+)
+
+
+JSON_SCENARIO = DogfoodScenario(
+    id="S2",
+    name="JSON Format Scan",
+    description="Test",
+    command=["codesentinel", "scan", "./sample-project", "--format", "json"],
+    output_format="json"
+)
+
+MARKDOWN_SCENARIO = DogfoodScenario(
+    id="S1",
+    name="Markdown Scan",
+    description="Test",
+    command=["codesentinel", "scan", "./sample-project", "--format", "markdown"],
+    output_format="markdown"
+)
+
 
+@pytest.fixture(scope="module")
+def debug_runner():
+    """Runner with debug findings enabled, built once per module."""
+    return DogfoodRunner(
+        target_path="./sample-project",
+        output_dir="./test-output",
+        debug_findings=True
+    )
 
-class TestDogfoodRunnerJSONExtraction(unittest.TestCase):
+
+@pytest.fixture(scope="module")
+def scenario_runner():
+    """Runner used by the scenario tests, built once per module."""
+    return DogfoodRunner(
+        target_path="./sample-project",
+        output_dir="./test-output",
+        debug_findings=False
+    )
+
+
+class TestDogfoodRunnerJSONExtraction:
     """Test JSON extraction and findings counting logic."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.runner = DogfoodRunner(
-            target_path="./sample-project",
-            output_dir="./test-output",
-            debug_findings=True
-        )
+    # Serialized once at import; the counting tests only read them
+    JSON_WITH_FINDINGS_ARRAY = json.dumps({
+        "findings": [
+            {"rule_id": "test1", "file": "file1.py"},
+            {"rule_id": "test2", "file": "file2.py"}
+        ]
+    })
+    JSON_WITH_SCAN_SUMMARY = json.dumps({
+        "scan_summary": {
+            "total_findings": 152,
+            "by_severity": {
+                "high": 128,
+                "medium": 24
+            }
+        },
+        "findings": [{"rule_id": "test1"}, {"rule_id": "test2"}]  # Actual findings array
+    })
+    JSON_WITH_RESULTS_ARRAY = json.dumps({
+        "results": [
+            {"finding": 1},
+            {"finding": 2},
+            {"finding": 3}
+        ]
+    })
+    JSON_TOP_LEVEL_ARRAY = json.dumps([
+        {"rule_id": "test1"},
+        {"rule_id": "test2"},
+        {"rule_id": "test3"}
+    ])
+    
+    @pytest.fixture(autouse=True)
+    def _runner(self, debug_runner):
+        """Give each test its own shallow copy of the shared runner."""
+        self.runner = copy.copy(debug_runner)
         
     def test_extract_json_from_clean_output(self):
         """Test extracting JSON from clean output without log messages."""
         clean_json = '{"findings": [{"id": 1}, {"id": 2}], "summary": "test"}'
         result = self.runner._extract_json_from_output(clean_json)
-        self.assertEqual(result, clean_json)
+        assert result == clean_json
         
     def test_extract_json_from_output_with_logs(self):
         """Test extracting JSON from output with log messages."""
@@ -57,9 +129,18 @@ Module severity does not export 'rules' list, using legacy class discovery
 }"""
         result = self.runner._extract_json_from_output(output_with_logs)
         # Should extract the JSON part only
-        self.assertTrue(result.startswith('{'))
-        self.assertTrue('"scan_summary"' in result)
-        self.assertTrue('"findings"' in result)
+        assert result.startswith('{')
+        assert '"scan_summary"' in result
+        assert '"findings"' in result
+        
+    def test_extract_json_from_output_is_memoized(self):
+        """Test that repeated extraction of the same output hits the cache."""
+        output = 'Scanning 1 files...\n{"findings": [{"id": 1}]}'
+        extract_json_from_output.cache_clear()
+        first = self.runner._extract_json_from_output(output)
+        second = self.runner._extract_json_from_output(output)
+        assert first == second
+        assert extract_json_from_output.cache_info().hits == 1
         
     def test_extract_json_from_malformed_output(self):
         """Test extracting JSON from malformed output."""
@@ -67,167 +148,113 @@ Module severity does not export 'rules' list, using legacy class discovery
 { "incomplete": "json"""
         result = self.runner._extract_json_from_output(malformed_output)
         # Should return the original input if JSON is malformed
-        self.assertEqual(result, malformed_output)
+        assert result == malformed_output
         
     def test_count_findings_from_json_with_findings_array(self):
         """Test counting findings from JSON with findings array."""
-        json_data = {
-            "findings": [
-                {"rule_id": "test1", "file": "file1.py"},
-                {"rule_id": "test2", "file": "file2.py"}
-            ]
-        }
-        count = self.runner._count_findings_from_json(json.dumps(json_data))
-        self.assertEqual(count, 2)
+        count = self.runner._count_findings_from_json(self.JSON_WITH_FINDINGS_ARRAY)
+        assert count == 2
         
     def test_count_findings_from_json_with_scan_summary(self):
         """Test counting findings from JSON with scan_summary."""
-        json_data = {
-            "scan_summary": {
-                "total_findings": 152,
-                "by_severity": {
-                    "high": 128,
-                    "medium": 24
-                }
-            },
-            "findings": [{"rule_id": "test1"}, {"rule_id": "test2"}]  # Actual findings array
-        }
-        count = self.runner._count_findings_from_json(json.dumps(json_data))
-        self.assertEqual(count, 2)  # Should use findings array length, not scan_summary
+        count = self.runner._count_findings_from_json(self.JSON_WITH_SCAN_SUMMARY)
+        assert count == 2  # Should use findings array length, not scan_summary
         
     def test_count_findings_from_json_with_results_array(self):
         """Test counting findings from JSON with results array."""
-        json_data = {
-            "results": [
-                {"finding": 1},
-                {"finding": 2},
-                {"finding": 3}
-            ]
-        }
-        count = self.runner._count_findings_from_json(json.dumps(json_data))
-        self.assertEqual(count, 3)
+        count = self.runner._count_findings_from_json(self.JSON_WITH_RESULTS_ARRAY)
+        assert count == 3
         
     def test_count_findings_from_json_top_level_array(self):
         """Test counting findings from JSON that is a top-level array."""
-        json_data = [
-            {"rule_id": "test1"},
-            {"rule_id": "test2"},
-            {"rule_id": "test3"}
-        ]
-        count = self.runner._count_findings_from_json(json.dumps(json_data))
-        self.assertEqual(count, 3)
+        count = self.runner._count_findings_from_json(self.JSON_TOP_LEVEL_ARRAY)
+        assert count == 3
+        
+    def test_count_findings_from_large_report(self, big_findings_json):
+        """Test counting findings from a large report with log lines around it."""
+        output = "Scanning 5000 files...\n" + big_findings_json + "\nScan complete\n"
+        count = self.runner._count_findings_from_json(output)
+        assert count == 5000
         
     def test_count_findings_from_invalid_json(self):
         """Test counting findings from invalid JSON."""
         invalid_json = "This is not JSON"
         count = self.runner._count_findings_from_json(invalid_json)
-        self.assertEqual(count, 0)
+        assert count == 0
         
     def test_count_findings_from_empty_json(self):
         """Test counting findings from empty JSON object."""
         empty_json = "{}"
         count = self.runner._count_findings_from_json(empty_json)
-        self.assertEqual(count, 0)
+        assert count == 0
 
 
-class TestDogfoodRunnerDebugMode(unittest.TestCase):
+class TestDogfoodRunnerDebugMode:
     """Test debug mode functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.runner = DogfoodRunner(
-            target_path="./sample-project",
-            output_dir="./test-output",
-            debug_findings=True
-        )
-        
-    @patch('tools.dogfood_runner.DogfoodRunner.execute_command')
-    def test_run_direct_scan_comparison_success(self, mock_execute):
-        """Test direct scan comparison with successful execution."""
-        # Mock successful command execution with JSON output
-        mock_execute.return_value = {
-            "success": True,
-            "stdout": '{"findings": [{"id": 1}, {"id": 2}]}',
-            "stderr": "",
-            "exit_code": 0,
-            "runtime": 1.0
-        }
+    @pytest.fixture(autouse=True)
+    def _runner(self, debug_runner):
+        """Give each test its own shallow copy of the shared runner."""
+        self.runner = copy.copy(debug_runner)
         
-        scenario = DogfoodScenario(
-            id="S2",
-            name="JSON Format Scan",
-            description="Test",
-            command=["codesentinel", "scan", "./sample-project", "--format", "json"],
-            output_format="json"
-        )
+    @pytest.mark.parametrize(
+        "execute_result, scenario, expected",
+        [
+            pytest.param(
+                {
+                    "success": True,
+                    "stdout": '{"findings": [{"id": 1}, {"id": 2}]}',
+                    "stderr": "",
+                    "exit_code": 0,
+                    "runtime": 1.0
+                },
+                JSON_SCENARIO,
+                2,
+                id="success",
+            ),
+            pytest.param(
+                {
+                    "success": False,
+                    "stdout": "",
+                    "stderr": "Command failed",
+                    "exit_code": 1,
+                    "runtime": 0.5
+                },
+                JSON_SCENARIO,
+                0,
+                id="failure",
+            ),
+            pytest.param(
+                {
+                    "success": True,
+                    "stdout": "Markdown output\n# Findings\n- Finding 1\n- Finding 2",
+                    "stderr": "",
+                    "exit_code": 0,
+                    "runtime": 1.0
+                },
+                MARKDOWN_SCENARIO,
+                0,
+                id="non_json",
+            ),
+        ],
+    )
+    def test_run_direct_scan_comparison(self, execute_result, scenario, expected):
+        """Test direct scan comparison counts findings only for successful JSON scans."""
+        self.runner.execute_command = MagicMock(return_value=execute_result)
         
         count = self.runner._run_direct_scan_comparison(scenario)
-        self.assertEqual(count, 2)
-        mock_execute.assert_called_once_with(scenario.command, self.runner.timeout)
-        
-    @patch('tools.dogfood_runner.DogfoodRunner.execute_command')
-    def test_run_direct_scan_comparison_failure(self, mock_execute):
-        """Test direct scan comparison with failed execution."""
-        # Mock failed command execution
-        mock_execute.return_value = {
-            "success": False,
-            "stdout": "",
-            "stderr": "Command failed",
-            "exit_code": 1,
-            "runtime": 0.5
-        }
-        
-        scenario = DogfoodScenario(
-            id="S2",
-            name="JSON Format Scan",
-            description="Test",
-            command=["codesentinel", "scan", "./sample-project", "--format", "json"],
-            output_format="json"
-        )
-        
-        count = self.runner._run_direct_scan_comparison(scenario)
-        self.assertEqual(count, 0)
-        
-    @patch('tools.dogfood_runner.DogfoodRunner.execute_command')
-    def test_run_direct_scan_comparison_non_json(self, mock_execute):
-        """Test direct scan comparison with non-JSON scenario."""
-        # Mock successful command execution but non-JSON format
-        mock_execute.return_value = {
-            "success": True,
-            "stdout": "Markdown output\n# Findings\n- Finding 1\n- Finding 2",
-            "stderr": "",
-            "exit_code": 0,
-            "runtime": 1.0
-        }
-        
-        scenario = DogfoodScenario(
-            id="S1",
-            name="Markdown Scan",
-            description="Test",
-            command=["codesentinel", "scan", "./sample-project", "--format", "markdown"],
-            output_format="markdown"
-        )
-        
-        count = self.runner._run_direct_scan_comparison(scenario)
-        self.assertEqual(count, 0)
+        assert count == expected
+        self.runner.execute_command.assert_called_once_with(scenario.command, self.runner.timeout)
 
 
-class TestDogfoodRunnerScenarios(unittest.TestCase):
+class TestDogfoodRunnerScenarios:
     """Test scenario setup and execution."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.runner = DogfoodRunner(
-            target_path="./sample-project",
-            output_dir=self.temp_dir,
-            debug_findings=False
-        )
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def _runner(self, scenario_runner, tmp_path):
+        """Give each test a copy of the shared runner writing to its own temp dir."""
+        self.runner = copy.copy(scenario_runner)
+        self.runner.output_dir = tmp_path
         
     def test_setup_scenarios_without_ai(self):
         """Test scenario setup without AI enabled."""
@@ -235,15 +262,15 @@ class TestDogfoodRunnerScenarios(unittest.TestCase):
         self.runner.setup_scenarios()
         
         # Should have 5 scenarios (S1, S2, S3, S6, S7) - AI scenarios filtered out
-        self.assertEqual(len(self.runner.scenarios), 5)
+        assert len(self.runner.scenarios) == 5
         scenario_ids = [s.id for s in self.runner.scenarios]
-        self.assertIn("S1", scenario_ids)
-        self.assertIn("S2", scenario_ids)
-        self.assertIn("S3", scenario_ids)
-        self.assertIn("S6", scenario_ids)
-        self.assertIn("S7", scenario_ids)
-        self.assertNotIn("S4", scenario_ids)  # AI scenario
-        self.assertNotIn("S5", scenario_ids)  # AI scenario
+        assert "S1" in scenario_ids
+        assert "S2" in scenario_ids
+        assert "S3" in scenario_ids
+        assert "S6" in scenario_ids
+        assert "S7" in scenario_ids
+        assert "S4" not in scenario_ids  # AI scenario
+        assert "S5" not in scenario_ids  # AI scenario
         
     def test_setup_scenarios_with_ai(self):
         """Test scenario setup with AI enabled."""
@@ -253,10 +280,10 @@ class TestDogfoodRunnerScenarios(unittest.TestCase):
             self.runner.setup_scenarios()
             
             # Should have 7 scenarios when AI is enabled
-            self.assertEqual(len(self.runner.scenarios), 7)
+            assert len(self.runner.scenarios) == 7
             scenario_ids = [s.id for s in self.runner.scenarios]
-            self.assertIn("S4", scenario_ids)  # AI scenario
-            self.assertIn("S5", scenario_ids)  # AI scenario
+            assert "S4" in scenario_ids  # AI scenario
+            assert "S5" in scenario_ids  # AI scenario
             
     def test_find_sample_file(self):
         """Test finding a representative sample file."""
@@ -272,7 +299,7 @@ class TestDogfoodRunnerScenarios(unittest.TestCase):
             sample_file = self.runner._find_sample_file()
             
             # Should find a Python file first
-            self.assertTrue(sample_file.endswith(".py") or sample_file.endswith(".js"))
+            assert sample_file.endswith(".py") or sample_file.endswith(".js")
             
     def test_find_sample_file_no_files(self):
         """Test finding sample file when no files exist."""
@@ -281,71 +308,54 @@ class TestDogfoodRunnerScenarios(unittest.TestCase):
             sample_file = self.runner._find_sample_file()
             
             # Should return the directory itself
-            self.assertEqual(sample_file, str(self.runner.target_path))
+            assert sample_file == str(self.runner.target_path)
 
 
-class TestDogfoodRunnerIntegration(unittest.TestCase):
+class TestDogfoodRunnerIntegration:
     """Integration tests for the dogfood runner."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-        
+    VERSION_CHECK_OK = subprocess.CompletedProcess(
+        args=["codesentinel", "version"],
+        returncode=0,
+        stdout="CodeSentinel v0.2.0",
+        stderr=""
+    )
+    
     @patch('tools.dogfood_runner.subprocess.run')
-    def test_validate_environment_success(self, mock_subprocess):
+    def test_validate_environment_success(self, mock_subprocess, tmp_path):
         """Test environment validation with successful checks."""
         # Mock successful codesentinel version check
-        mock_subprocess.return_value.returncode = 0
-        mock_subprocess.return_value.stdout = "CodeSentinel v0.2.0"
+        mock_subprocess.return_value = self.VERSION_CHECK_OK
         
+        # Real target and output directories, so no Path methods need patching
         runner = DogfoodRunner(
-            target_path="./sample-project",
-            output_dir=self.temp_dir
+            target_path=str(tmp_path),
+            output_dir=str(tmp_path / "output")
         )
         
-        # Mock target path exists and is directory
-        with patch.object(pathlib.Path, 'exists', return_value=True), \
-             patch.object(pathlib.Path, 'is_dir', return_value=True), \
-             patch.object(pathlib.Path, 'mkdir'):
-            
-            result = runner.validate_environment()
-            self.assertTrue(result)
+        result = runner.validate_environment()
+        assert result
             
     @patch('tools.dogfood_runner.subprocess.run')
-    def test_validate_environment_codesentinel_not_found(self, mock_subprocess):
+    def test_validate_environment_codesentinel_not_found(self, mock_subprocess, tmp_path):
         """Test environment validation when codesentinel is not available."""
         # Mock codesentinel not found
         mock_subprocess.side_effect = FileNotFoundError
         
         runner = DogfoodRunner(
-            target_path="./sample-project",
-            output_dir=self.temp_dir
+            target_path=str(tmp_path),
+            output_dir=str(tmp_path / "output")
         )
         
-        # Mock target path exists and is directory
-        with patch.object(pathlib.Path, 'exists', return_value=True), \
-             patch.object(pathlib.Path, 'is_dir', return_value=True):
-            
-            result = runner.validate_environment()
-            self.assertFalse(result)
+        result = runner.validate_environment()
+        assert not result
             
-    def test_validate_environment_target_not_exists(self):
+    def test_validate_environment_target_not_exists(self, tmp_path):
         """Test environment validation when target doesn't exist."""
         runner = DogfoodRunner(
             target_path="/nonexistent/path",
-            output_dir=self.temp_dir
+            output_dir=str(tmp_path)
         )
         
-        # Mock target path doesn't exist
-        with patch.object(pathlib.Path, 'exists', return_value=False):
-            result = runner.validate_environment()
-            self.assertFalse(result)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+        result = runner.validate_environment()
+        assert not result
@@ -5,15 +5,19 @@ Tests rule discovery, loading, application, and error handling using
 mock rules defined inline to avoid import issues.
 """
 
+import functools
 import pathlib
-import tempfile
-from unittest.mock import patch, MagicMock
+import re
 import pytest
 
 from sentinel.rules.base import Finding, Rule
 from sentinel.scanner.engine import RuleLoader, run_rules
 
 
+# Whole lines containing the marker MockSimpleRule reports on
+_TEST_PATTERN_LINE = re.compile(r'^.*TEST_PATTERN.*$', re.MULTILINE)
+
+
 # Define test rule classes inline to avoid import issues
 # Using "Mock" prefix to avoid pytest collection warnings
 class MockSimpleRule:
@@ -23,20 +27,21 @@ class MockSimpleRule:
         self.id = "MOCK_SIMPLE_RULE"
         self.description = "Mock simple rule for pattern matching"
         self.severity = "medium"
+        self._make_finding = functools.partial(
+            Finding, rule_id=self.id, severity=self.severity, confidence=0.8
+        )
 
     def apply(self, path, text):
+        if "TEST_PATTERN" not in text:
+            return []
+
         findings = []
-        lines = text.split('\n')
-        for i, line in enumerate(lines, 1):
-            if "TEST_PATTERN" in line:
-                findings.append(Finding(
-                    rule_id=self.id,
-                    file_path=path,
-                    line=i,
-                    severity=self.severity,
-                    excerpt=line.strip(),
-                    confidence=0.8
-                ))
+        for match in _TEST_PATTERN_LINE.finditer(text):
+            findings.append(self._make_finding(
+                file_path=path,
+                line=text.count('\n', 0, match.start()) + 1,
+                excerpt=match.group().strip(),
+            ))
         return findings
 
 
@@ -66,25 +71,20 @@ class MockErrorRule:
         return []
 
 
-class TestRuleLoader:
-    """Test cases for RuleLoader class."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.test_rules_dir = pathlib.Path(tempfile.mkdtemp())
-        # Create __init__.py to make it a package
-        (self.test_rules_dir / "__init__.py").write_text("# Test rules package")
+@pytest.fixture(scope="module")
+def rules_root(tmp_path_factory):
+    """
+    Create the rule directories used by the RuleLoader tests once per module.
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.test_rules_dir)
+    Each scenario gets its own subdirectory so tests can share the tree
+    without seeing each other's rule files.
+    """
+    root = tmp_path_factory.mktemp("rules")
 
-    def test_load_rules_valid_directory(self):
-        """Test loading rules from a valid directory."""
-        # Create test rule files
-        rule1_file = self.test_rules_dir / "test_rule1.py"
-        rule1_file.write_text('''
+    valid_dir = root / "valid"
+    valid_dir.mkdir()
+    (valid_dir / "__init__.py").write_text("# Test rules package")
+    (valid_dir / "test_rule1.py").write_text('''
 class TestRule1:
     def __init__(self):
         self.id = "TEST_RULE_1"
@@ -94,9 +94,7 @@ class TestRule1:
     def apply(self, path, text):
         return []
 ''')
-
-        rule2_file = self.test_rules_dir / "test_rule2.py"
-        rule2_file.write_text('''
+    (valid_dir / "test_rule2.py").write_text('''
 class TestRule2:
     def __init__(self):
         self.id = "TEST_RULE_2"
@@ -107,29 +105,15 @@ class TestRule2:
         return []
 ''')
 
-        loader = RuleLoader(self.test_rules_dir)
-        rules = loader.load_rules()
-
-        assert len(rules) == 2
-        rule_ids = {rule.id for rule in rules}
-        assert "TEST_RULE_1" in rule_ids
-        assert "TEST_RULE_2" in rule_ids
-
-    def test_load_rules_skips_base_and_init(self):
-        """Test that base.py and __init__.py are skipped."""
-        # Create files that should be skipped
-        base_file = self.test_rules_dir / "base.py"
-        base_file.write_text('''
+    # Files that should be skipped alongside a single valid rule
+    with_base_dir = root / "with_base"
+    with_base_dir.mkdir()
+    (with_base_dir / "base.py").write_text('''
 class BaseRule:
     pass
 ''')
-
-        init_file = self.test_rules_dir / "__init__.py"
-        init_file.write_text("# Empty init")
-
-        # Create a valid rule file
-        valid_rule = self.test_rules_dir / "valid_rule.py"
-        valid_rule.write_text('''
+    (with_base_dir / "__init__.py").write_text("# Empty init")
+    (with_base_dir / "valid_rule.py").write_text('''
 class ValidRule:
     def __init__(self):
         self.id = "VALID_RULE"
@@ -140,7 +124,27 @@ class ValidRule:
         return []
 ''')
 
-        loader = RuleLoader(self.test_rules_dir)
+    (root / "not_a_dir.py").write_text("# Not a directory")
+
+    return root
+
+
+class TestRuleLoader:
+    """Test cases for RuleLoader class."""
+
+    def test_load_rules_valid_directory(self, rules_root):
+        """Test loading rules from a valid directory."""
+        loader = RuleLoader(rules_root / "valid")
+        rules = loader.load_rules()
+
+        assert len(rules) == 2
+        rule_ids = {rule.id for rule in rules}
+        assert "TEST_RULE_1" in rule_ids
+        assert "TEST_RULE_2" in rule_ids
+
+    def test_load_rules_skips_base_and_init(self, rules_root):
+        """Test that base.py and __init__.py are skipped."""
+        loader = RuleLoader(rules_root / "with_base")
         rules = loader.load_rules()
 
         assert len(rules) == 1
@@ -154,12 +158,9 @@ class ValidRule:
         with pytest.raises(FileNotFoundError):
             loader.load_rules()
 
-    def test_load_rules_file_instead_of_directory(self):
+    def test_load_rules_file_instead_of_directory(self, rules_root):
         """Test loading rules when path is a file, not directory."""
-        file_path = self.test_rules_dir / "not_a_dir.py"
-        file_path.write_text("# Not a directory")
-
-        loader = RuleLoader(file_path)
+        loader = RuleLoader(rules_root / "not_a_dir.py")
 
         with pytest.raises(ValueError):
             loader.load_rules()
@@ -168,32 +169,17 @@ class ValidRule:
 class TestRunRules:
     """Test cases for run_rules function."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-
-    @patch('sentinel.scanner.engine.RuleLoader')
-    def test_run_rules_with_findings(self, mock_loader):
+    def test_run_rules_with_findings(self, tmp_path):
         """Test run_rules with files that generate findings."""
         # Create test files
-        file1 = pathlib.Path(self.temp_dir) / "test1.py"
+        file1 = tmp_path / "test1.py"
         file1.write_text("TEST_PATTERN_123\nLINE_NUMBER_456")
 
-        file2 = pathlib.Path(self.temp_dir) / "test2.py"
+        file2 = tmp_path / "test2.py"
         file2.write_text("TEST_PATTERN_789")
 
-        # Mock the rule loader to return our test rules
-        mock_loader_instance = MagicMock()
-        mock_loader_instance.load_rules.return_value = [MockSimpleRule()]
-        mock_loader.return_value = mock_loader_instance
-
         files = [file1, file2]
-        findings = run_rules(files)
+        findings = run_rules(files, rules=[MockSimpleRule()])
 
         # Should find 2 patterns total: one in file1 (line 1), one in file2 (line 1)
         assert len(findings) == 2
@@ -206,63 +192,40 @@ class TestRunRules:
         assert file1_finding.line == 1
         assert file2_finding.line == 1
 
-    @patch('sentinel.scanner.engine.RuleLoader')
-    def test_run_rules_empty_findings(self, mock_loader):
+    def test_run_rules_empty_findings(self, tmp_path):
         """Test run_rules with files that generate no findings."""
         # Create test file with no patterns
-        file1 = pathlib.Path(self.temp_dir) / "test.py"
+        file1 = tmp_path / "test.py"
         file1.write_text("normal content without patterns")
 
-        # Mock the rule loader to return test rules
-        mock_loader_instance = MagicMock()
-        mock_loader_instance.load_rules.return_value = [MockEmptyRule()]
-        mock_loader.return_value = mock_loader_instance
-
         files = [file1]
-        findings = run_rules(files)
+        findings = run_rules(files, rules=[MockEmptyRule()])
 
         assert len(findings) == 0
 
-    @patch('sentinel.scanner.engine.RuleLoader')
-    def test_run_rules_error_handling(self, mock_loader):
+    def test_run_rules_error_handling(self, tmp_path):
         """Test run_rules error handling when rules raise exceptions."""
         # Create test file that triggers errors
-        file1 = pathlib.Path(self.temp_dir) / "test.py"
+        file1 = tmp_path / "test.py"
         file1.write_text("RAISE_VALUE_ERROR")
 
-        # Mock the rule loader to return error rule
-        mock_loader_instance = MagicMock()
-        mock_loader_instance.load_rules.return_value = [MockErrorRule()]
-        mock_loader.return_value = mock_loader_instance
-
         files = [file1]
-        findings = run_rules(files)
+        findings = run_rules(files, rules=[MockErrorRule()])
 
         # Should handle the error gracefully and continue
         assert len(findings) == 0
 
-    @patch('sentinel.scanner.engine.RuleLoader')
-    def test_run_rules_nonexistent_file(self, mock_loader):
+    def test_run_rules_nonexistent_file(self, tmp_path):
         """Test run_rules with nonexistent files."""
-        nonexistent_file = pathlib.Path(self.temp_dir) / "nonexistent.py"
-
-        # Mock the rule loader to return empty rules
-        mock_loader_instance = MagicMock()
-        mock_loader_instance.load_rules.return_value = [MockEmptyRule()]
-        mock_loader.return_value = mock_loader_instance
+        nonexistent_file = tmp_path / "nonexistent.py"
 
         files = [nonexistent_file]
-        findings = run_rules(files)
+        findings = run_rules(files, rules=[MockEmptyRule()])
 
         # Should handle nonexistent file gracefully
         assert len(findings) == 0
 
-    @patch('sentinel.scanner.engine.RuleLoader')
-    def test_run_rules_no_rules_loaded(self, mock_loader):
+    def test_run_rules_no_rules_loaded(self):
         """Test run_rules when no rules are loaded."""
-        mock_loader_instance = MagicMock()
-        mock_loader_instance.load_rules.return_value = []
-        mock_loader.return_value = mock_loader_instance
-
         with pytest.raises(RuntimeError, match="No rules were successfully loaded"):
-            run_rules([pathlib.Path("test.py")])
+            run_rules([pathlib.Path("test.py")], rules=[])
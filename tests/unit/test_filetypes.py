@@ -10,7 +10,7 @@ SPDX-License-Identifier: MIT
 import pathlib
 import pytest
 
-from sentinel.utils.filetypes import detect_language
+from sentinel.utils.filetypes import _detect_language_by_name, detect_language
 
 
 class TestDetectLanguage:
@@ -132,4 +132,11 @@ class TestDetectLanguage:
         assert isinstance(result, str) or result is None
         
         result = detect_language(pathlib.Path("unknown.xyz"))
-        assert result is None
\ No newline at end of file
+        assert result is None
+
+    def test_same_name_in_different_directories_is_cached(self):
+        """Test that detection is memoized on the file name, not the full path."""
+        _detect_language_by_name.cache_clear()
+        assert detect_language(pathlib.Path("src/app.py")) == "python"
+        assert detect_language(pathlib.Path("tests/app.py")) == "python"
+        assert _detect_language_by_name.cache_info().hits == 1
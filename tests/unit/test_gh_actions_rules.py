@@ -16,6 +16,7 @@ class TestGHAUtils(unittest.TestCase):
         self.assertFalse(is_gha_workflow("src/app.py"))
         self.assertFalse(is_gha_workflow(".github/config.yml")) # Not in workflows dir
         self.assertFalse(is_gha_workflow(".github/workflows/config.txt"))
+        self.assertTrue(is_gha_workflow("C:\\repo\\.github\\workflows\\ci.yml"))
 
 class TestGHARulePack(unittest.TestCase):
     def setUp(self):
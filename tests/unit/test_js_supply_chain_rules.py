@@ -16,6 +16,7 @@ class TestJSCUtils(unittest.TestCase):
         self.assertTrue(is_package_json("frontend/package.json"))
         self.assertFalse(is_package_json("package-lock.json"))
         self.assertFalse(is_package_json("config.json"))
+        self.assertFalse(is_package_json("frontend/mypackage.json"))
 
 
 class TestJSCRulePack(unittest.TestCase):
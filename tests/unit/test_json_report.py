@@ -112,6 +112,26 @@ class TestJSONReport:
         assert report_data["scan_summary"]["by_severity"]["medium"] == 1
         assert report_data["scan_summary"]["by_severity"]["low"] == 1
 
+    def test_generate_json_report_critical_severity(self):
+        """Test that critical findings are counted in the severity summary."""
+        findings = [
+            Finding(
+                rule_id="GHA001",
+                file_path=pathlib.Path("/test/.github/workflows/ci.yml"),
+                line=1,
+                severity="critical",
+                excerpt="permissions: write-all",
+                confidence=0.95
+            )
+        ]
+        
+        report = generate_json_report(findings)
+        report_data = json.loads(report)
+        
+        assert report_data["scan_summary"]["total_findings"] == 1
+        assert report_data["scan_summary"]["by_severity"] == {"critical": 1, "high": 0, "medium": 0, "low": 0}
+        assert report_data["findings"][0]["severity"] == "critical"
+
     def test_generate_json_report_finding_structure(self):
         """Test that each finding has the expected structure."""
         findings = [
@@ -18,9 +18,78 @@ import sys
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=128)
+def extract_json_from_output(output: str) -> str:
+    """
+    Extract JSON content from output that may contain log messages.
+
+    Memoized because the result depends only on the output text, and rerun
+    scenarios often produce identical output.
+    """
+    # Look for the first occurrence of '{' or '['
+    start_index = output.find('{')
+    if start_index == -1:
+        start_index = output.find('[')
+    if start_index == -1:
+        return output  # No JSON found, return original
+    
+    # Extract from the first JSON character to the end
+    json_content = output[start_index:]
+    
+    # Validate that it's proper JSON by decoding the leading value; raw_decode
+    # also reports where the value ends, so trailing log lines after a
+    # complete document are trimmed without a second scan
+    try:
+        _, end_index = _JSON_DECODER.raw_decode(json_content)
+        if json_content[end_index:].strip(" \t\n\r"):
+            return json_content[:end_index]
+        return json_content
+    except json.JSONDecodeError:
+        # If parsing fails, try to find the complete JSON object
+        # Count braces to find the complete structure
+        brace_count = 0
+        bracket_count = 0
+        in_string = False
+        escape_next = False
+        
+        for i, char in enumerate(json_content):
+            if escape_next:
+                escape_next = False
+                continue
+                
+            if char == '\\':
+                escape_next = True
+                continue
+                
+            if char == '"' and not escape_next:
+                in_string = not in_string
+                continue
+                
+            if not in_string:
+                if char == '{':
+                    brace_count += 1
+                elif char == '}':
+                    brace_count -= 1
+                elif char == '[':
+                    bracket_count += 1
+                elif char == ']':
+                    bracket_count -= 1
+            
+            # If we've found the end of the JSON structure
+            if brace_count == 0 and bracket_count == 0 and i > 0:
+                return json_content[:i+1]
+        
+        # If we couldn't find complete structure, return original
+        return output
+
+
 @dataclass
 class DogfoodScenario:
     """Represents a single dogfooding scenario configuration."""
@@ -286,58 +355,7 @@ class DogfoodRunner:
             
     def _extract_json_from_output(self, output: str) -> str:
         """Extract JSON content from output that may contain log messages."""
-        # Look for the first occurrence of '{' or '['
-        start_index = output.find('{')
-        if start_index == -1:
-            start_index = output.find('[')
-        if start_index == -1:
-            return output  # No JSON found, return original
-        
-        # Extract from the first JSON character to the end
-        json_content = output[start_index:]
-        
-        # Validate that it's proper JSON by finding matching braces
-        try:
-            # Try to parse to validate JSON structure
-            json.loads(json_content)
-            return json_content
-        except json.JSONDecodeError:
-            # If parsing fails, try to find the complete JSON object
-            # Count braces to find the complete structure
-            brace_count = 0
-            bracket_count = 0
-            in_string = False
-            escape_next = False
-            
-            for i, char in enumerate(json_content):
-                if escape_next:
-                    escape_next = False
-                    continue
-                    
-                if char == '\\':
-                    escape_next = True
-                    continue
-                    
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-                    
-                if not in_string:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                    elif char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        bracket_count -= 1
-                
-                # If we've found the end of the JSON structure
-                if brace_count == 0 and bracket_count == 0 and i > 0:
-                    return json_content[:i+1]
-            
-            # If we couldn't find complete structure, return original
-            return output
+        return extract_json_from_output(output)
             
     def _count_findings_from_json(self, json_content: str) -> int:
         """Count findings from JSON output content."""